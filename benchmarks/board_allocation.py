@@ -0,0 +1,62 @@
+"""Measure the time and memory needed to allocate and mine a GameBoard.
+
+Run from the project root:
+    python -m benchmarks.board_allocation
+"""
+import time
+import tracemalloc
+from models.game_board import GameBoard
+
+
+# (side of the square board, number of mines)
+BOARD_CASES = [
+    (100, 100 * 100 // 6),
+    (300, 300 * 300 // 6),
+    (1000, 1000 * 1000 // 6),
+    (2000, 1000),     # Sparse: random.sample takes its set branch
+    (2000, 800000),   # Dense: random.sample takes its pool branch
+]
+
+
+def measure(size, mines):
+    """Allocate a square board and place its mines.
+
+    Args:
+        size (int): Number of rows and columns of the board
+        mines (int): Number of mines
+
+    Returns:
+        tuple: (allocation seconds, allocation peak bytes, placement seconds,
+            placement peak bytes)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    board = GameBoard(size, size, mines, seed=1)
+    allocation_time = time.perf_counter() - start
+    _, allocation_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    board.place_mines(size // 2, size // 2)
+    placement_time = time.perf_counter() - start
+
+    # Traced separately, tracing slows the placement down
+    board = GameBoard(size, size, mines, seed=1)
+    tracemalloc.start()
+    board.place_mines(size // 2, size // 2)
+    _, placement_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocation_time, allocation_peak, placement_time, placement_peak
+
+
+def main():
+    print(f"{'board':>11} {'mines':>8} {'alloc':>10} {'peak':>10} {'place_mines':>12} {'peak':>10}")
+    for size, mines in BOARD_CASES:
+        allocation_time, allocation_peak, placement_time, placement_peak = measure(size, mines)
+        print(f"{size:>5}x{size:<5} {mines:>8} {allocation_time * 1000:>8.1f}ms "
+              f"{allocation_peak / 1e6:>8.2f}MB {placement_time * 1000:>10.1f}ms "
+              f"{placement_peak / 1e6:>8.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
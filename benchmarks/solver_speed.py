@@ -0,0 +1,72 @@
+"""Measure how many moves per second the solver deduces on the standard presets.
+
+Each game starts from the board centre. The solver is asked for moves
+until the game ends; when it is stuck a random hidden cell is clicked.
+Only the time spent in the solver is counted.
+
+Run from the project root:
+    python -m benchmarks.solver_speed
+"""
+import random
+import time
+from models.game_session import GameSession
+from models.presets import DIFFICULTY_LEVELS
+from models.solver import Solver
+
+
+GAMES_PER_PRESET = 200
+
+
+def solve_game(height, width, mines, seed):
+    """Play one game with the solver.
+
+    Args:
+        height (int): Board height
+        width (int): Board width
+        mines (int): Number of mines
+        seed (int): Random seed of the board
+
+    Returns:
+        tuple: (deduced moves, seconds spent in the solver)
+    """
+    session = GameSession(height, width, mines, seed)
+    solver = Solver(session.board)
+    rng = random.Random(seed)
+    revealed = session.click(height // 2, width // 2)
+    moves = 0
+    solver_time = 0.0
+
+    while not session.is_over:
+        start = time.perf_counter()
+        solver.update(revealed)
+        solver.solve()
+        solver_time += time.perf_counter() - start
+
+        if solver.safe:
+            moves += 1
+            revealed = session.click(*divmod(min(solver.safe), width))
+            continue
+
+        hidden = [index for index in range(height * width)
+                  if not session.board.revealed_mask[index] and index not in solver.known_mines]
+        if not hidden:
+            break
+        revealed = session.click(*divmod(rng.choice(hidden), width))
+
+    return moves + len(solver.known_mines), solver_time
+
+
+def main():
+    print(f"{'preset':>10} {'moves':>8} {'solver time':>12} {'moves/s':>10}")
+    for name, settings in DIFFICULTY_LEVELS.items():
+        total_moves = 0
+        total_time = 0.0
+        for seed in range(GAMES_PER_PRESET):
+            moves, solver_time = solve_game(settings['height'], settings['width'], settings['mines'], seed)
+            total_moves += moves
+            total_time += solver_time
+        print(f"{name:>10} {total_moves:>8} {total_time:>11.3f}s {total_moves / total_time:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Startup budget check.
+
+Each measurement runs in a fresh interpreter, started in an empty scratch
+directory, so nothing is already imported and no score, seed or saved
+game file is around:
+- importing every ``models`` module, which must not load tkinter;
+- importing ``game``, the application module;
+- building the application until its menu is drawn (time to first frame),
+  which must not create any file. It is skipped without a display.
+
+The best time over a few runs is checked against its budget, and the
+script exits with status 1 if a budget or a rule is broken.
+
+Run from the project root:
+    python -m benchmarks.startup
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Default budgets in seconds
+MODELS_IMPORT_BUDGET = 0.05
+GAME_IMPORT_BUDGET = 0.15
+FIRST_FRAME_BUDGET = 0.5
+
+REPEAT = 5
+
+MODELS_IMPORT = """
+import importlib, json, os, pkgutil, sys, time
+names = ['models.' + module.name
+         for module in pkgutil.iter_modules([os.path.join(os.environ['PYTHONPATH'], 'models')])]
+start = time.perf_counter()
+for name in ['models'] + names:
+    importlib.import_module(name)
+print(json.dumps({'seconds': time.perf_counter() - start, 'tkinter': 'tkinter' in sys.modules}))
+"""
+
+GAME_IMPORT = """
+import json, time
+start = time.perf_counter()
+import game
+print(json.dumps({'seconds': time.perf_counter() - start}))
+"""
+
+FIRST_FRAME = """
+import json, time
+start = time.perf_counter()
+import tkinter
+from game import MinesweeperGame
+try:
+    application = MinesweeperGame()
+except tkinter.TclError:
+    print(json.dumps({'skipped': True}))
+else:
+    application.root.update()
+    print(json.dumps({'seconds': time.perf_counter() - start}))
+    application.root.destroy()
+"""
+
+
+def run_script(script):
+    """Run a measurement in a fresh interpreter and an empty directory.
+
+    Args:
+        script (str): Python code printing its result as JSON on the last line
+
+    Returns:
+        tuple: (result dictionary, names of the files left in the directory)
+    """
+    environment = dict(os.environ, PYTHONPATH=str(ROOT))
+    environment.pop('DEMINEUR_INSTRUMENT', None)
+    with tempfile.TemporaryDirectory() as directory:
+        output = subprocess.run([sys.executable, '-c', script], cwd=directory, env=environment,
+                                capture_output=True, text=True, check=True).stdout
+        files = sorted(path.name for path in Path(directory).iterdir())
+    return json.loads(output.splitlines()[-1]), files
+
+
+def measure(script, repeat=REPEAT):
+    """Keep the best of several runs of a measurement.
+
+    Args:
+        script (str): Measurement script
+        repeat (int): Number of runs
+
+    Returns:
+        tuple: (best result dictionary, files created by any run)
+    """
+    best = None
+    created = set()
+    for _ in range(repeat):
+        result, files = run_script(script)
+        created.update(files)
+        if result.get('skipped'):
+            return result, sorted(created)
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best, sorted(created)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the startup time budgets.")
+    parser.add_argument('--models-budget', type=float, default=MODELS_IMPORT_BUDGET,
+                        help=f"seconds allowed to import the models (default: {MODELS_IMPORT_BUDGET})")
+    parser.add_argument('--game-budget', type=float, default=GAME_IMPORT_BUDGET,
+                        help=f"seconds allowed to import the game module (default: {GAME_IMPORT_BUDGET})")
+    parser.add_argument('--frame-budget', type=float, default=FIRST_FRAME_BUDGET,
+                        help=f"seconds allowed until the menu is drawn (default: {FIRST_FRAME_BUDGET})")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    failures = []
+
+    models, _ = measure(MODELS_IMPORT)
+    print(f"{'import models':<20} {models['seconds'] * 1000:>10.1f}ms", file=sys.stderr)
+    if models['tkinter']:
+        failures.append("importing the models loads tkinter")
+    if models['seconds'] > args.models_budget:
+        failures.append(f"importing the models takes {models['seconds'] * 1000:.1f}ms")
+
+    game, _ = measure(GAME_IMPORT)
+    print(f"{'import game':<20} {game['seconds'] * 1000:>10.1f}ms", file=sys.stderr)
+    if game['seconds'] > args.game_budget:
+        failures.append(f"importing the game takes {game['seconds'] * 1000:.1f}ms")
+
+    frame, created = measure(FIRST_FRAME)
+    if frame.get('skipped'):
+        print(f"{'first frame':<20} {'skipped, no display':>12}", file=sys.stderr)
+    else:
+        print(f"{'first frame':<20} {frame['seconds'] * 1000:>10.1f}ms", file=sys.stderr)
+        if frame['seconds'] > args.frame_budget:
+            failures.append(f"drawing the menu takes {frame['seconds'] * 1000:.1f}ms")
+        if created:
+            failures.append(f"starting the game creates {', '.join(created)}")
+
+    for failure in failures:
+        print(f"OVER BUDGET {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
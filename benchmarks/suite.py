@@ -0,0 +1,283 @@
+"""Reproducible benchmark suite for the models package.
+
+Times the board operations across board sizes and the score and seed
+storage across history lengths, records the best time over a few runs
+and the peak memory of one traced run, and writes everything to a JSON
+file. Passing a previous result file with --compare flags every case
+that got slower than the tolerance allows.
+
+Run from the project root:
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --compare before.json
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from models.game_board import GameBoard
+from models.score_database import SqliteScoreManager
+from models.score_manager import ScoreManager
+from models.seed_manager import SeedManager
+
+
+# (height, width, mines) of the benchmarked boards
+BOARD_SIZES = [(16, 30, 99), (100, 100, 1500), (500, 500, 40000), (1000, 1000, 160000)]
+QUICK_BOARD_SIZES = BOARD_SIZES[:2]
+
+# Number of scores already recorded when saving or loading scores
+HISTORY_LENGTHS = [100, 1000, 10000]
+QUICK_HISTORY_LENGTHS = HISTORY_LENGTHS[:2]
+
+REPEAT = 3
+
+
+def measure(setup, action, repeat=REPEAT):
+    """Time an action and record its peak memory.
+
+    Args:
+        setup (callable): Builds the action argument, not measured
+        action (callable): Measured operation taking the setup result
+        repeat (int): Timed runs, the best one is kept
+
+    Returns:
+        dict: Best time in seconds and peak traced memory in bytes
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        argument = setup()
+        gc.collect()
+        start = time.perf_counter()
+        action(argument)
+        best = min(best, time.perf_counter() - start)
+
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    action(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak}
+
+
+def mined_board(height, width, mines):
+    """Build a board with its mines placed around the centre."""
+    board = GameBoard(height, width, mines, seed=1)
+    board.place_mines(height // 2, width // 2)
+    return board
+
+
+def empty_board(height, width):
+    """Build a board whose only mine sits in the last cell.
+
+    Revealing the first cell then opens the whole board, the worst case
+    for ``reveal_cell``.
+    """
+    board = GameBoard(height, width, 1, seed=1, first_click=(0, 0))
+    board.mine_mask[:] = bytes(len(board.mine_mask))
+    board.placed_mines = 0
+    board.hidden_safe_cells = height * width
+    board.cells[height - 1][width - 1].place_mine()
+    board._calculate_adjacent_mines()
+    return board
+
+
+def board_cases(sizes):
+    """Yield the board benchmark cases.
+
+    Args:
+        sizes (list): (height, width, mines) of the boards
+
+    Yields:
+        tuple: (case name, setup, action)
+    """
+    for height, width, mines in sizes:
+        label = f"{height}x{width}"
+        yield (f"board.create[{label}]",
+               lambda: None,
+               lambda _, h=height, w=width, m=mines: GameBoard(h, w, m, seed=1))
+        yield (f"board.place_mines[{label}]",
+               lambda h=height, w=width, m=mines: GameBoard(h, w, m, seed=1),
+               lambda board: board.place_mines(board.height // 2, board.width // 2))
+        yield (f"board.adjacency[{label}]",
+               lambda h=height, w=width, m=mines: mined_board(h, w, m),
+               lambda board: board._calculate_adjacent_mines())
+        yield (f"board.reveal_cell_worst[{label}]",
+               lambda h=height, w=width: empty_board(h, w),
+               lambda board: board.reveal_cell(0, 0))
+        yield (f"board.check_win[{label}]",
+               lambda h=height, w=width, m=mines: mined_board(h, w, m),
+               lambda board: board.check_win())
+
+
+def write_legacy_scores(path, count):
+    """Write a score history in the original high_scores.json format.
+
+    Args:
+        path (Path): File to write
+        count (int): Number of scores
+    """
+    presets = [(9, 9, 10), (10, 10, 10), (16, 16, 40), (16, 30, 99), (20, 25, 80)]
+    scores = []
+    for number in range(count):
+        width, height, mines = presets[number % len(presets)]
+        scores.append({'name': f"player{number % 97}", 'time': 10 + number % 300,
+                       'width': width, 'height': height, 'mines': mines,
+                       'date': '2024-11-13 23:25:36', 'seed': 1731536735 + number,
+                       'first_click': [0, 0]})
+    scores.sort(key=lambda x: (x['width'], x['height'], x['mines'], x['time']))
+    with open(path, 'w') as f:
+        json.dump(scores, f)
+
+
+def storage_cases(history_lengths, directory):
+    """Yield the score and seed storage benchmark cases.
+
+    Args:
+        history_lengths (list): Numbers of scores already recorded
+        directory (Path): Scratch directory for the storage files
+
+    Yields:
+        tuple: (case name, setup, action)
+    """
+    for count in history_lengths:
+        def score_manager(count=count):
+            legacy_path = directory / f"scores_{count}.json"
+            log_path = directory / f"scores_{count}.jsonl"
+            write_legacy_scores(legacy_path, count)
+            if log_path.exists():
+                log_path.unlink()
+            # The legacy history is imported into a fresh log on first use
+            manager = ScoreManager(log_path, legacy_path)
+            manager._ensure_file_exists()
+            return manager
+
+        yield (f"scores.save[{count}]",
+               score_manager,
+               lambda manager: manager.save_score('bench', 42, 30, 16, 99, 1, (8, 15)))
+        yield (f"scores.load[{count}]",
+               score_manager,
+               lambda manager: manager.get_high_scores())
+
+        def warm_score_manager(count=count):
+            manager = score_manager(count)
+            manager.configs()
+            return manager
+
+        yield (f"scores.load_cached[{count}]",
+               warm_score_manager,
+               lambda manager: manager.scores_for((30, 16, 99)))
+
+        def sqlite_score_manager(count=count):
+            legacy_path = directory / f"scores_{count}.json"
+            database_path = directory / f"scores_{count}.db"
+            write_legacy_scores(legacy_path, count)
+            for path in directory.glob(f"scores_{count}.db*"):
+                path.unlink()
+            manager = SqliteScoreManager(database_path, None, legacy_path)
+            manager.connection  # Creates the database and imports the legacy history
+            return manager
+
+        yield (f"scores_sqlite.save[{count}]",
+               sqlite_score_manager,
+               lambda manager: manager.save_score('bench', 42, 30, 16, 99, 1, (8, 15)))
+        yield (f"scores_sqlite.top_n[{count}]",
+               sqlite_score_manager,
+               lambda manager: manager.top_n((30, 16, 99), 50))
+
+    def seed_manager():
+        path = directory / "seeds.bin"
+        if path.exists():
+            path.unlink()
+        manager = SeedManager(path, capacity=1000, legacy_file=None)
+        for seed in range(1000):
+            manager.save_seed(seed, 30, 16, 99, (8, 15))
+        return manager
+
+    yield ("seeds.save", seed_manager, lambda manager: manager.save_seed(99, 30, 16, 99, (8, 15)))
+    yield ("seeds.load", seed_manager, lambda manager: manager.get_recent_seeds())
+
+
+def run(quick=False):
+    """Run every benchmark case.
+
+    Args:
+        quick (bool): Only run the smaller sizes
+
+    Returns:
+        dict: Run metadata and per-case results
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cases = list(board_cases(QUICK_BOARD_SIZES if quick else BOARD_SIZES))
+        cases += list(storage_cases(QUICK_HISTORY_LENGTHS if quick else HISTORY_LENGTHS, Path(directory)))
+        for name, setup, action in cases:
+            results[name] = measure(setup, action)
+            print(f"{name:<40} {results[name]['seconds'] * 1000:>10.3f}ms "
+                  f"{results[name]['peak_bytes'] / 1e6:>9.2f}MB", file=sys.stderr)
+
+    return {
+        'meta': {
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, tolerance, min_slowdown):
+    """List the cases that got slower than a baseline allows.
+
+    Args:
+        current (dict): Results of this run
+        baseline (dict): Results of a previous run
+        tolerance (float): Allowed relative slowdown, 0.25 for 25%
+        min_slowdown (float): Slowdowns below this many seconds are timer
+            noise and never flagged
+
+    Returns:
+        list: (case name, baseline seconds, current seconds) of regressions
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if (previous and result['seconds'] > previous['seconds'] * (1 + tolerance)
+                and result['seconds'] - previous['seconds'] > min_slowdown):
+            regressions.append((name, previous['seconds'], result['seconds']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the models package.")
+    parser.add_argument('--quick', action='store_true', help="only run the smaller sizes")
+    parser.add_argument('--output', metavar='FILE', help="write the results to this JSON file")
+    parser.add_argument('--compare', metavar='FILE', help="flag regressions against a previous result file")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed relative slowdown before flagging a regression (default: 0.25)")
+    parser.add_argument('--min-slowdown', type=float, default=0.002,
+                        help="slowdowns under this many seconds are never flagged (default: 0.002)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    current = run(args.quick)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance, args.min_slowdown)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before * 1000:.3f}ms -> {after * 1000:.3f}ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
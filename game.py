@@ -2,12 +2,14 @@ import tkinter as tk
 from tkinter import messagebox
 import time
 from models.game_board import GameBoard
-from models.score_manager import ScoreManager
+from models.journal import GameJournal
+from models.move_log import CHORD, FLAG, REVEAL, MoveLog
+from models.no_guess import NoGuessCache
+from models.score_manager import create_score_manager
 from models.seed_manager import SeedManager
 from ui.menu_ui import MenuUI
 from ui.game_ui import GameUI
-from ui.score_dialog import ScoreDialog, ScoresWindow
-from ui.replay_dialog import ReplayDialog
+# Dialogs and the replay player are imported when first opened, to keep them off the startup path
 
 
 class MinesweeperGame:
@@ -15,23 +17,37 @@ class MinesweeperGame:
         self.root = tk.Tk()
         self.root.title("Des mineurs")
         self.root.geometry("1000x800")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self.score_manager = ScoreManager()
+        self.score_manager = create_score_manager()
         self.seed_manager = SeedManager()
+        self.no_guess_cache = NoGuessCache()
+        self.journal = GameJournal()
         self.game_board = None
+        self.move_log = None
         self.game_ui = None
+        self.replay_ui = None
         self.menu_ui = None
         self.start_time = None
         self.timer_id = None
 
-        self.show_menu()
+        # Pick up the game that was being played when the application last stopped
+        if self.journal.exists():
+            self.resume_game()
+        else:
+            self.show_menu()
 
     def show_menu(self):
         """Display the main menu."""
         if self.game_ui:
             self.game_ui.destroy()
+        if self.replay_ui:
+            self.replay_ui.destroy()
+            self.replay_ui = None
 
-        self.menu_ui = MenuUI(self.root, self.start_game, self.show_high_scores, self.show_replay_dialog)
+        self.menu_ui = MenuUI(self.root, self.start_game, self.show_high_scores, self.show_replay_dialog,
+                              self.no_guess_cache,
+                              on_resume_game=self.resume_game if self.journal.exists() else None)
 
     def show_replay_dialog(self):
         """Show the replay dialog with recent games."""
@@ -39,6 +55,8 @@ class MinesweeperGame:
         if not recent_seeds:
             messagebox.showinfo("Replay", "Aucune partie précédente disponible!")
             return
+        from ui.replay_dialog import ReplayDialog
+
         ReplayDialog(self.root, recent_seeds, self.start_game_with_seed_data)
 
     def start_game_with_seed_data(self, seed_data):
@@ -69,12 +87,14 @@ class MinesweeperGame:
             self.menu_ui.destroy()
 
         self.game_board = GameBoard(height, width, mines, seed, first_click)
+        self.move_log = MoveLog(width)
 
         self.game_ui = GameUI(self.root, self.game_board,
                               self.on_cell_click, self.on_right_click,
-                              self.return_to_menu)
+                              self.return_to_menu, self.on_chord)
 
         self.start_timer()
+        self.start_journal()
 
     def on_cell_click(self, x, y):
         """Handle left click on a cell.
@@ -92,17 +112,19 @@ class MinesweeperGame:
                 self.game_board.mines,
                 (x, y)
             )
+            self.start_journal()
 
         cell = self.game_board.cells[x][y]
         if cell.is_flagged or cell.is_revealed:
             return
 
+        move = self.move_log.record(REVEAL, x, y)
         if cell.is_mine:
             self.game_over()
         else:
             revealed_cells = self.game_board.reveal_cell(x, y)
-            for rx, ry in revealed_cells:
-                self.game_ui.update_cell(rx, ry)
+            self.journal.record_reveal(move, revealed_cells)
+            self.game_ui.update_cells(revealed_cells)
 
             if self.game_board.check_win():
                 self.win_game()
@@ -114,17 +136,66 @@ class MinesweeperGame:
             x (int): Cell x coordinate
             y (int): Cell y coordinate
         """
-        cell = self.game_board.cells[x][y]
-        if cell.toggle_flag():
+        if self.game_board.toggle_flag(x, y):
+            move = self.move_log.record(FLAG, x, y)
+            if self.game_board.game_started:
+                self.journal.record_flag(move, x, y, self.game_board.cells[x][y].is_flagged)
             self.game_ui.update_cell(x, y)
             if self.game_board.check_win():
                 self.win_game()
 
-    def start_timer(self):
-        """Start the game timer."""
-        self.start_time = time.time()
+    def on_chord(self, x, y):
+        """Handle middle click, or click with both buttons, on a cell.
+
+        Reveals every unflagged neighbour of a satisfied number in one batch.
+
+        Args:
+            x (int): Cell x coordinate
+            y (int): Cell y coordinate
+        """
+        if not self.game_board.game_started:
+            return
+        revealed_cells = self.game_board.chord(x, y)
+        if not revealed_cells:
+            return
+
+        move = self.move_log.record(CHORD, x, y)
+        self.game_ui.update_cells(revealed_cells)
+        # A wrong flag makes the chord reveal a mine, only among the first cells
+        if any(self.game_board.cells[rx][ry].is_mine for rx, ry in revealed_cells[:8]):
+            self.game_over()
+            return
+
+        self.journal.record_reveal(move, revealed_cells)
+        if self.game_board.check_win():
+            self.win_game()
+
+    def start_journal(self):
+        """Start autosaving the current game, once its mines are placed.
+
+        Boards replayed from a seed have their mines placed when they are
+        created, other boards on the first click.
+        """
+        if self.game_board.game_started:
+            self.journal.start(self.game_board, self.move_log, self.elapsed_time)
+
+    def start_timer(self, elapsed=0):
+        """Start the game timer.
+
+        Args:
+            elapsed (float): Seconds already played, for a resumed game
+        """
+        self.start_time = time.time() - elapsed
         self.update_timer()
 
+    def elapsed_time(self):
+        """Get the time played in the current game.
+
+        Returns:
+            float: Seconds since the game started
+        """
+        return time.time() - self.start_time
+
     def update_timer(self):
         """Update the timer display."""
         if self.start_time is not None:
@@ -138,7 +209,7 @@ class MinesweeperGame:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
 
-    def start_game(self, height, width, mines, seed=None, first_click=None):
+    def start_game(self, height, width, mines, seed=None, first_click=None, reveal_first_click=False):
         """Start a new game with given parameters.
 
         Args:
@@ -147,6 +218,8 @@ class MinesweeperGame:
             mines (int): Number of mines
             seed (int, optional): Random seed
             first_click (tuple, optional): First click coordinates
+            reveal_first_click (bool): Open the first click cell for the player,
+                as no-guess boards are only guaranteed from that cell
         """
         try:
             if height <= 0 or width <= 0 or mines <= 0:
@@ -158,12 +231,17 @@ class MinesweeperGame:
                 self.menu_ui.destroy()
 
             self.game_board = GameBoard(height, width, mines, seed, first_click)
+            self.move_log = MoveLog(width)
 
             self.game_ui = GameUI(self.root, self.game_board,
                                   self.on_cell_click, self.on_right_click,
-                                  self.return_to_menu)
+                                  self.return_to_menu, self.on_chord)
 
             self.start_timer()
+            self.start_journal()
+
+            if reveal_first_click and first_click is not None:
+                self.on_cell_click(*first_click)
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -171,6 +249,7 @@ class MinesweeperGame:
     def game_over(self):
         """Handle game over state."""
         self.stop_timer()
+        self.journal.discard()
         self.game_ui.show_mines()
         messagebox.showinfo("Game Over", "Vous avez perdu!")
         self.return_to_menu()
@@ -178,6 +257,7 @@ class MinesweeperGame:
     def win_game(self):
         """Handle game win state."""
         self.stop_timer()
+        self.journal.discard()
         elapsed_time = int(time.time() - self.start_time)
 
         def save_score(player_name):
@@ -188,25 +268,99 @@ class MinesweeperGame:
                 self.game_board.height,
                 self.game_board.mines,
                 self.game_board.get_seed(),
-                self.game_board.first_click_position
+                self.game_board.first_click_position,
+                moves=self.move_log.to_bytes()
             )
             self.return_to_menu()
 
+        from ui.score_dialog import ScoreDialog
+
         ScoreDialog(self.root, elapsed_time, save_score)
 
     def show_high_scores(self):
         """Display the high scores window."""
-        scores = self.score_manager.get_high_scores()
-        if not scores:
+        if not self.score_manager.configs():
             messagebox.showinfo("Scores", "Aucun score enregistré!")
             return
-        ScoresWindow(self.root, scores, on_replay=self.start_game_with_seed)
+        from ui.score_dialog import ScoresWindow
+
+        ScoresWindow(self.root, self.score_manager, on_replay=self.start_game_with_seed,
+                     on_watch=self.watch_game)
+
+    def watch_game(self, score):
+        """Play back the recorded moves of a score.
+
+        Args:
+            score (dict): Score with its seed, first click and move log
+        """
+        from models.replay import Replay
+        from ui.replay_ui import ReplayUI
+
+        try:
+            replay = Replay.from_score(score)
+        except ValueError as e:
+            messagebox.showerror("Erreur", str(e))
+            return
+
+        if self.menu_ui:
+            self.menu_ui.destroy()
+        self.replay_ui = ReplayUI(self.root, replay, self.return_to_menu)
 
     def return_to_menu(self):
-        """Return to the main menu."""
+        """Return to the main menu.
+
+        A game left unfinished stays saved and can be resumed from the menu.
+        """
         self.stop_timer()
+        if self.game_in_progress():
+            self.journal.checkpoint()
+        self.journal.close()
+        self.game_board = None
         self.show_menu()
 
+    def game_in_progress(self):
+        """Check if a started game is still being played.
+
+        Returns:
+            bool: True if the board has been clicked and the game is neither won nor lost
+        """
+        return (self.game_board is not None and self.game_board.game_started
+                and self.game_ui is not None and not self.game_ui.disabled
+                and not self.game_board.check_win())
+
+    def on_close(self):
+        """Checkpoint the game in progress, if any, and close the window."""
+        self.no_guess_cache.stop()
+        if self.game_in_progress():
+            self.journal.checkpoint()
+        self.journal.close()
+        self.root.destroy()
+
+    def resume_game(self):
+        """Resume the saved game, restoring the board before drawing it once."""
+        try:
+            board, elapsed, move_log = self.journal.restore()
+        except (OSError, ValueError) as e:
+            self.journal.discard()
+            messagebox.showerror("Erreur", f"Impossible de reprendre la partie: {e}")
+            if self.menu_ui:
+                self.menu_ui.destroy()
+            self.show_menu()
+            return
+
+        if self.menu_ui:
+            self.menu_ui.destroy()
+
+        self.game_board = board
+        self.move_log = move_log
+
+        self.game_ui = GameUI(self.root, self.game_board,
+                              self.on_cell_click, self.on_right_click,
+                              self.return_to_menu, self.on_chord)
+
+        self.start_timer(elapsed)
+        self.journal.start(self.game_board, self.move_log, self.elapsed_time)
+
     def run(self):
         """Start the game application."""
         self.root.mainloop()
@@ -0,0 +1,5 @@
+"""Game engine: boards, solver, replays and storage.
+
+Nothing in this package imports tkinter, so it can be used without a
+display, from scripts, benchmarks and worker processes.
+"""
@@ -0,0 +1,67 @@
+"""Whole-grid adjacent-mine counting.
+
+Both engines compute, for every cell, the sum of the mine mask over its
+3x3 neighbourhood on a zero-padded grid, then clear the count of mined
+cells. They return byte-identical results; NumPy is used when installed.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+def compute_adjacent_counts(mine_mask, height, width):
+    """Count the mines around every cell of a board.
+
+    Args:
+        mine_mask (bytearray): Flat mine flags indexed by ``x * width + y``
+        height (int): Number of rows in the board
+        width (int): Number of columns in the board
+
+    Returns:
+        bytearray: Flat adjacent-mine counts, 0 for mined cells
+    """
+    if np is not None:
+        return _compute_with_numpy(mine_mask, height, width)
+    return _compute_with_python(mine_mask, height, width)
+
+
+def _compute_with_numpy(mine_mask, height, width):
+    """Neighbourhood sum using array slices of the padded mask."""
+    mask = np.frombuffer(bytes(mine_mask), dtype=np.uint8).reshape(height, width)
+    padded = np.pad(mask, 1)
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dx in range(3):
+        for dy in range(3):
+            counts += padded[dx:dx + height, dy:dy + width]
+    counts[mask != 0] = 0
+    return bytearray(counts.tobytes())
+
+
+def _compute_with_python(mine_mask, height, width):
+    """Neighbourhood sum using big-integer arithmetic.
+
+    The padded mask is read as one little-endian integer with a byte per
+    cell. Shifting by one byte moves the grid one column, shifting by a
+    padded row moves it one row. A sum never exceeds 9, so adding nine
+    shifted copies never carries into the next byte and the whole grid is
+    summed in a handful of C-level operations.
+    """
+    stride = width + 2
+    rows = [b'\0' + mine_mask[x * width:(x + 1) * width] + b'\0' for x in range(height)]
+    padded = bytes(stride) + b''.join(rows) + bytes(stride)
+
+    grid = int.from_bytes(padded, 'little')
+    horizontal = grid + (grid << 8) + (grid >> 8)
+    total = horizontal + (horizontal << (8 * stride)) + (horizontal >> (8 * stride))
+    summed = total.to_bytes(len(padded), 'little')
+
+    counts = b''.join(summed[(x + 1) * stride + 1:(x + 1) * stride + 1 + width] for x in range(height))
+
+    # Clear mined cells: AND every count with 0xFF, or 0x00 under a mine
+    keep = bytes(mine_mask).translate(_KEEP_NON_MINES)
+    cleared = int.from_bytes(counts, 'little') & int.from_bytes(keep, 'little')
+    return bytearray(cleared.to_bytes(len(counts), 'little'))
+
+
+_KEEP_NON_MINES = bytes([0xFF] + [0x00] * 255)
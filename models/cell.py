@@ -1,24 +1,49 @@
 class Cell:
-    """Represents a single cell in the Minesweeper grid."""
+    """Represents a single cell in the Minesweeper grid.
 
-    def __init__(self, x, y):
-        """Initialize a new cell.
+    A cell does not own any state: it is a thin view over the flat buffers
+    of its GameBoard, indexed by ``x * width + y``. Views are created on
+    demand and are cheap to throw away.
+    """
+
+    __slots__ = ('board', 'x', 'y', 'index')
+
+    def __init__(self, board, x, y):
+        """Initialize a new cell view.
 
         Args:
+            board (GameBoard): Board holding the cell state
             x (int): Row position
             y (int): Column position
         """
+        self.board = board
         self.x = x
         self.y = y
-        self.is_mine = False      # Indicates if the cell contains a mine
-        self.is_revealed = False  # Indicates if the cell has been clicked and revealed
-        self.is_flagged = False   # Indicates if the cell has been marked with a flag
-        self.adjacent_mines = 0   # Number of mines in adjacent cells
-        self.button = None        # Reference to the cell's button widget in the UI
+        self.index = x * board.width + y
+
+    @property
+    def is_mine(self):
+        """bool: Indicates if the cell contains a mine."""
+        return bool(self.board.mine_mask[self.index])
+
+    @property
+    def is_revealed(self):
+        """bool: Indicates if the cell has been clicked and revealed."""
+        return bool(self.board.revealed_mask[self.index])
+
+    @property
+    def is_flagged(self):
+        """bool: Indicates if the cell has been marked with a flag."""
+        return bool(self.board.flagged_mask[self.index])
+
+    @property
+    def adjacent_mines(self):
+        """int: Number of mines in adjacent cells."""
+        return self.board.adjacent_counts[self.index]
 
     def reveal(self):
         """Mark the cell as revealed when clicked."""
-        self.is_revealed = True
+        self.board._mark_revealed(self.index)
 
     def toggle_flag(self):
         """Toggle the flagged state of the cell.
@@ -26,14 +51,11 @@ class Cell:
         Returns:
             bool: True if the flag state was changed, False if cell was already revealed
         """
-        if not self.is_revealed:
-            self.is_flagged = not self.is_flagged
-            return True
-        return False
+        return self.board.toggle_flag(self.x, self.y)
 
     def place_mine(self):
         """Place a mine in this cell during board initialization."""
-        self.is_mine = True
+        self.board._mark_mine(self.index)
 
     def set_adjacent_mines(self, count):
         """Set the number of adjacent mines for this cell.
@@ -41,4 +63,62 @@ class Cell:
         Args:
             count (int): Number of mines in cells adjacent to this cell
         """
-        self.adjacent_mines = count
+        self.board.adjacent_counts[self.index] = count
+
+
+class CellRow:
+    """Read-only sequence of the Cell views of one board row."""
+
+    __slots__ = ('board', 'x')
+
+    def __init__(self, board, x):
+        """Initialize a row view.
+
+        Args:
+            board (GameBoard): Board holding the cell state
+            x (int): Row position
+        """
+        self.board = board
+        self.x = x
+
+    def __len__(self):
+        return self.board.width
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.board.width:
+            raise IndexError("cell column out of range")
+        return Cell(self.board, self.x, y)
+
+    def __iter__(self):
+        for y in range(self.board.width):
+            yield Cell(self.board, self.x, y)
+
+
+class CellGrid:
+    """2D view giving ``grid[x][y]`` access to the cells of a board.
+
+    Keeps the historical ``board.cells[x][y]`` interface working without
+    allocating one object per cell up front.
+    """
+
+    __slots__ = ('board',)
+
+    def __init__(self, board):
+        """Initialize the grid view.
+
+        Args:
+            board (GameBoard): Board holding the cell state
+        """
+        self.board = board
+
+    def __len__(self):
+        return self.board.height
+
+    def __getitem__(self, x):
+        if not 0 <= x < self.board.height:
+            raise IndexError("cell row out of range")
+        return CellRow(self.board, x)
+
+    def __iter__(self):
+        for x in range(self.board.height):
+            yield CellRow(self.board, x)
@@ -1,9 +1,29 @@
 import random
 import time
-from .cell import Cell
+from collections.abc import Sequence
+from itertools import chain
+from math import ceil, log
+from .adjacency import compute_adjacent_counts
+from .cell import CellGrid
+from .instrumentation import instrument
 
 
 class GameBoard:
+    """Minesweeper board state.
+
+    Cell state lives in flat byte buffers indexed by ``x * width + y``
+    (see ``index``) instead of one object per cell, so even very large
+    boards cost a few bytes per cell. ``cells[x][y]`` still returns a
+    Cell view over these buffers.
+
+    Running counters of hidden safe cells and flagged mines are kept up to
+    date by every mutation so that ``check_win`` does not scan the grid.
+    Set ``CHECK_COUNTERS`` to True (e.g. in tests) to verify them against
+    a full scan after each mutation.
+    """
+
+    CHECK_COUNTERS = False
+
     def __init__(self, height, width, mines, seed=None, first_click=None):
         """Initialize the game board.
 
@@ -18,7 +38,7 @@ class GameBoard:
         self.width = width
         self.mines = mines
         self.seed = seed if seed is not None else int(time.time())  # Use current time as default seed
-        self.cells = self._create_cells()
+        self._create_cells()
         self.game_started = False                                   # Tracks if first click has occurred
         self.first_click_position = first_click                     # Stores first click for replays
 
@@ -27,12 +47,31 @@ class GameBoard:
             self.place_mines(*first_click)
 
     def _create_cells(self):
-        """Create the initial grid of empty cells.
+        """Allocate the flat state buffers for an empty grid."""
+        size = self.height * self.width
+        self.mine_mask = bytearray(size)        # 1 where the cell holds a mine
+        self.revealed_mask = bytearray(size)    # 1 where the cell has been revealed
+        self.flagged_mask = bytearray(size)     # 1 where the cell carries a flag
+        self.adjacent_counts = bytearray(size)  # Number of mines around each cell
+        self.cells = CellGrid(self)
+        self._offsets_table = None              # Flood fill neighbour offsets, built on first use
+
+        # Win detection counters
+        self.placed_mines = 0                   # Mines currently on the board
+        self.hidden_safe_cells = size           # Safe cells not revealed yet
+        self.flagged_mines = 0                  # Mines carrying a flag
+
+    def index(self, x, y):
+        """Get the buffer index of a cell.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
 
         Returns:
-            list: 2D list of Cell objects
+            int: Offset of the cell in the state buffers
         """
-        return [[Cell(x, y) for y in range(self.width)] for x in range(self.height)]
+        return x * self.width + y
 
     def get_seed(self):
         """Get the current board's random seed.
@@ -42,27 +81,27 @@ class GameBoard:
         """
         return self.seed
 
-    def _get_safe_zone_positions(self, first_x, first_y):
-        """Calculate positions that should not contain mines around first click.
+    def _get_safe_zone_indices(self, first_x, first_y):
+        """Calculate cells that should not contain mines around first click.
 
         Args:
             first_x (int): Row of first click
             first_y (int): Column of first click
 
         Returns:
-            set: Set of coordinate tuples marking safe positions
+            list: Sorted buffer indices of the safe cells
         """
-        safe_positions = set()
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                new_x, new_y = first_x + dx, first_y + dy
-                if 0 <= new_x < self.height and 0 <= new_y < self.width:
-                    safe_positions.add((new_x, new_y))
-        return safe_positions
+        return [x * self.width + y
+                for x in range(max(first_x - 1, 0), min(first_x + 2, self.height))
+                for y in range(max(first_y - 1, 0), min(first_y + 2, self.width))]
 
+    @instrument(cells=lambda result, board, *args: board.placed_mines)
     def place_mines(self, first_x, first_y):
         """Place mines on the board, ensuring first click is safe.
 
+        Mines are drawn with a board-private ``random.Random`` seeded with
+        the board seed, so the global random state is left untouched.
+
         Args:
             first_x (int): Row of first click
             first_y (int): Column of first click
@@ -70,14 +109,11 @@ class GameBoard:
         if self.first_click_position is None:
             self.first_click_position = (first_x, first_y)
 
-        random.seed(self.seed)
+        rng = random.Random(self.seed)
 
-        # Get positions that should be safe (around first click)
-        safe_positions = self._get_safe_zone_positions(first_x, first_y)
-
-        # Create list of all possible positions excluding safe zone
-        available_positions = [(x, y) for x in range(self.height) for y in range(self.width)
-                             if (x, y) not in safe_positions]
+        # Candidate cells are every cell outside the safe zone around the first click
+        available_positions = _CellsOutsideSafeZone(self.height * self.width,
+                                                    self._get_safe_zone_indices(first_x, first_y))
 
         # Adjust number of mines if there aren't enough available positions
         max_mines = len(available_positions)
@@ -85,79 +121,336 @@ class GameBoard:
             self.mines = max_mines
 
         # Randomly place mines
-        mine_positions = random.sample(available_positions, self.mines)
-        for x, y in mine_positions:
-            self.cells[x][y].place_mine()
+        for index in _sample(rng, available_positions, self.mines):
+            self._mark_mine(index)
 
         self._calculate_adjacent_mines()
         self.game_started = True
 
+        if self.CHECK_COUNTERS:
+            self.verify_counters()
+
+    @instrument(cells=lambda result, board: len(board.adjacent_counts))
     def _calculate_adjacent_mines(self):
         """Calculate number of adjacent mines for all cells."""
-        for x in range(self.height):
-            for y in range(self.width):
-                if not self.cells[x][y].is_mine:
-                    count = self._count_adjacent_mines(x, y)
-                    self.cells[x][y].set_adjacent_mines(count)
+        self.adjacent_counts = compute_adjacent_counts(self.mine_mask, self.height, self.width)
 
-    def _count_adjacent_mines(self, x, y):
-        """Count mines in cells adjacent to given position.
+    @instrument(cells=lambda result, *args: len(result))
+    def reveal_cell(self, x, y):
+        """Reveal a cell and flood-fill adjacent cells if it is empty.
 
         Args:
             x (int): Row position
             y (int): Column position
 
         Returns:
-            int: Number of adjacent mines
-        """
-        count = 0
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.height and
-                        0 <= new_y < self.width and
-                        self.cells[new_x][new_y].is_mine):
-                    count += 1
-        return count
+            list: Coordinate tuples of all cells revealed, each listed once,
+                starting with (x, y) followed by the flood fill in
+                breadth-first order
+        """
+        index = x * self.width + y
+        if self.revealed_mask[index] or self.flagged_mask[index]:
+            return []
+        return [divmod(index, self.width) for index in self._reveal_indices([index])]
 
-    def reveal_cell(self, x, y):
-        """Reveal a cell and recursively reveal adjacent cells if empty.
+    @instrument(cells=lambda result, *args: len(result))
+    def reveal_many(self, cells):
+        """Reveal several cells at once, with a single flood fill for all of them.
+
+        Overlapping empty regions are walked once and every revealed cell
+        is reported once, however many of the given cells reach it.
+
+        Args:
+            cells (iterable): Coordinate tuples of the cells to reveal;
+                revealed and flagged cells are skipped
+
+        Returns:
+            list: Coordinate tuples of all cells revealed, each listed once,
+                starting with the given cells followed by the flood fill in
+                breadth-first order
+        """
+        width = self.width
+        return [divmod(index, width) for index in self._reveal_indices([x * width + y for x, y in cells])]
+
+    @instrument(cells=lambda result, *args: len(result))
+    def chord(self, x, y):
+        """Reveal the unflagged neighbours of a satisfied number.
+
+        Does nothing unless the cell is a revealed number with exactly as
+        many flagged neighbours as adjacent mines. A wrongly placed flag
+        makes the chord reveal a mine.
 
         Args:
             x (int): Row position
             y (int): Column position
 
         Returns:
-            list: List of coordinate tuples of all cells revealed
+            list: Coordinate tuples of all cells revealed, as ``reveal_many``;
+                any mine revealed is among the first eight
         """
-        cell = self.cells[x][y]
-        if cell.is_revealed or cell.is_flagged:
+        index = x * self.width + y
+        count = self.adjacent_counts[index]
+        if not self.revealed_mask[index] or self.mine_mask[index] or not count:
             return []
 
-        revealed_cells = [(x, y)]
-        cell.reveal()
+        if self._offsets_table is None:
+            self._offsets_table = self._neighbour_offsets()
+        column = index % self.width
+        edges = (index < self.width) | (index >= len(self.revealed_mask) - self.width) << 1
+        sides = (column == 0) | (column == self.width - 1) << 1
+        neighbours = [index + offset for offset in self._offsets_table[edges * 4 + sides]]
+        if sum(self.flagged_mask[neighbour] for neighbour in neighbours) != count:
+            return []
+        return [divmod(index, self.width) for index in self._reveal_indices(neighbours)]
+
+    def _reveal_indices(self, indices):
+        """Reveal cells, flood-fill from all of them and update the win counters.
+
+        Args:
+            indices (list): Buffer indices of the cells to reveal; revealed
+                and flagged cells are skipped
+
+        Returns:
+            list: Indices of every cell revealed, each listed once
+        """
+        revealed_mask = self.revealed_mask
+        flagged_mask = self.flagged_mask
+        revealed = []
+        for index in indices:
+            if not revealed_mask[index] and not flagged_mask[index]:
+                revealed_mask[index] = 1
+                revealed.append(index)
+        mines = sum(self.mine_mask[index] for index in revealed)
+        self._flood_fill(revealed)
+
+        # Only the starting cells can be mines, flood fills stop at numbers
+        self.hidden_safe_cells -= len(revealed) - mines
+
+        if self.CHECK_COUNTERS:
+            self.verify_counters()
+        return revealed
+
+    def _mark_mine(self, index):
+        """Place a mine on a cell and update the win counters.
+
+        Args:
+            index (int): Buffer index of the cell
+        """
+        if self.mine_mask[index]:
+            return
+        self.mine_mask[index] = 1
+        self.placed_mines += 1
+        if not self.revealed_mask[index]:
+            self.hidden_safe_cells -= 1
+        if self.flagged_mask[index]:
+            self.flagged_mines += 1
+
+    def _mark_revealed(self, index):
+        """Reveal a single cell, without flood fill, and update the win counters.
+
+        Args:
+            index (int): Buffer index of the cell
+        """
+        if self.revealed_mask[index]:
+            return
+        self.revealed_mask[index] = 1
+        if not self.mine_mask[index]:
+            self.hidden_safe_cells -= 1
+
+    def toggle_flag(self, x, y):
+        """Toggle the flag on a cell.
 
-        # Recursively reveal adjacent cells if current cell has no adjacent mines
-        if cell.adjacent_mines == 0 and not cell.is_mine:
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    new_x, new_y = x + dx, y + dy
-                    if (0 <= new_x < self.height and
-                            0 <= new_y < self.width):
-                        revealed_cells.extend(self.reveal_cell(new_x, new_y))
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            bool: True if the flag state was changed, False if cell was already revealed
+        """
+        index = x * self.width + y
+        if self.revealed_mask[index]:
+            return False
+
+        self.flagged_mask[index] ^= 1
+        if self.mine_mask[index]:
+            self.flagged_mines += 1 if self.flagged_mask[index] else -1
+
+        if self.CHECK_COUNTERS:
+            self.verify_counters()
+        return True
+
+    def _neighbour_offsets(self):
+        """Build the index offsets of the in-bounds neighbours of a cell.
+
+        Returns:
+            list: 16 tuples of offsets, selected by ``edges * 4 + sides``
+                where ``edges`` has bit 0 set on the first row and bit 1 on
+                the last row, and ``sides`` the same for the first and last
+                column
+        """
+        table = []
+        for edges in range(4):
+            for sides in range(4):
+                table.append(tuple(
+                    dx * self.width + dy
+                    for dx in (-1, 0, 1)
+                    for dy in (-1, 0, 1)
+                    if (dx, dy) != (0, 0)
+                    and not (dx == -1 and edges & 1) and not (dx == 1 and edges & 2)
+                    and not (dy == -1 and sides & 1) and not (dy == 1 and sides & 2)
+                ))
+        return table
+
+    def _flood_fill(self, revealed):
+        """Expand already revealed cells through empty regions.
+
+        Works breadth-first with ``revealed`` as the queue and the revealed
+        mask as the visited bitmap, so every cell is queued at most once
+        and no recursion is involved.
+
+        Args:
+            revealed (list): Indices of freshly revealed cells; extended in place
+
+        Returns:
+            list: ``revealed``, extended with every cell revealed by the fill
+        """
+        width = self.width
+        last_column = width - 1
+        last_row_start = len(self.revealed_mask) - width
+        revealed_mask = self.revealed_mask
+        flagged_mask = self.flagged_mask
+        adjacent_counts = self.adjacent_counts
+        mine_mask = self.mine_mask
+        if self._offsets_table is None:
+            self._offsets_table = self._neighbour_offsets()
+        offsets_table = self._offsets_table
+        inner = offsets_table[0]
+
+        # Iterating over a list that grows while we walk it visits the
+        # appended cells too, which makes it a FIFO queue
+        for index in revealed:
+            if adjacent_counts[index] or mine_mask[index]:
+                continue
+
+            column = index % width
+            if 0 < column < last_column and width <= index < last_row_start:
+                offsets = inner
+            else:
+                edges = (index < width) | (index >= last_row_start) << 1
+                sides = (column == 0) | (column == last_column) << 1
+                offsets = offsets_table[edges * 4 + sides]
 
-        return revealed_cells
+            for offset in offsets:
+                neighbour = index + offset
+                if not revealed_mask[neighbour] and not flagged_mask[neighbour]:
+                    revealed_mask[neighbour] = 1
+                    revealed.append(neighbour)
 
+        return revealed
+
+    @instrument()
     def check_win(self):
         """Check if the game has been won.
 
         Returns:
             bool: True if all mines are flagged and all safe cells are revealed
         """
-        for row in self.cells:
-            for cell in row:
-                if cell.is_mine and not cell.is_flagged:
-                    return False
-                if not cell.is_mine and not cell.is_revealed:
-                    return False
-        return True
+        return self.hidden_safe_cells == 0 and self.flagged_mines == self.placed_mines
+
+    def verify_counters(self):
+        """Check the win counters against a full scan of the board.
+
+        Raises:
+            AssertionError: If a counter disagrees with the cell buffers
+        """
+        placed_mines = hidden_safe_cells = flagged_mines = 0
+        for is_mine, is_revealed, is_flagged in zip(self.mine_mask, self.revealed_mask, self.flagged_mask):
+            if is_mine:
+                placed_mines += 1
+                flagged_mines += is_flagged
+            elif not is_revealed:
+                hidden_safe_cells += 1
+
+        expected = (placed_mines, hidden_safe_cells, flagged_mines)
+        actual = (self.placed_mines, self.hidden_safe_cells, self.flagged_mines)
+        assert actual == expected, f"Counters (mines, hidden safe, flagged mines) are {actual}, expected {expected}"
+
+
+def _sample(rng, population, k):
+    """Draw distinct items as ``rng.sample`` does, in memory proportional to k.
+
+    Makes the same ``_randbelow`` draws as ``random.Random.sample``, so the
+    same seed picks the same items in the same order. Its pool branch,
+    taken for dense samples, copies the whole population into a list;
+    here only the pool slots that were swapped are kept, in a dict.
+
+    Args:
+        rng (random.Random): Random generator
+        population (Sequence): Items to draw from
+        k (int): Number of items to draw, at most ``len(population)``
+
+    Yields:
+        Drawn items
+    """
+    n = len(population)
+    randbelow = rng._randbelow
+    # Same choice of branch as random.Random.sample
+    setsize = 21
+    if k > 5:
+        setsize += 4 ** ceil(log(k * 3, 4))
+    if n <= setsize:
+        # Slot -> item moved there; slots that are missing still hold their own position
+        swaps = {}
+        for i in range(k):
+            j = randbelow(n - i)
+            last = n - i - 1
+            yield population[swaps.get(j, j)]
+            # The last slot leaves the pool, so it is never read again
+            swaps[j] = swaps.pop(last, last)
+    else:
+        selected = set()
+        for _ in range(k):
+            j = randbelow(n)
+            while j in selected:
+                j = randbelow(n)
+            selected.add(j)
+            yield population[j]
+
+
+class _CellsOutsideSafeZone(Sequence):
+    """Lazy sequence of the buffer indices of the cells outside the safe zone.
+
+    Behaves like the row-major list of candidate cells that was once built
+    for ``random.sample``, so the same seed still picks the same cells, but
+    maps each position to a cell index on access instead of storing it.
+    """
+
+    def __init__(self, size, safe_indices):
+        """Initialize the sequence.
+
+        Args:
+            size (int): Number of cells on the board
+            safe_indices (list): Sorted buffer indices of the safe cells
+        """
+        self.size = size
+        self.safe_indices = safe_indices
+
+    def __len__(self):
+        return self.size - len(self.safe_indices)
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise IndexError("candidate position out of range")
+        # Every safe cell at or before the candidate shifts it one cell further
+        index = position
+        for safe_index in self.safe_indices:
+            if safe_index > index:
+                break
+            index += 1
+        return index
+
+    def __iter__(self):
+        # Runs of consecutive candidates, so that random.sample can copy
+        # small populations at C speed
+        bounds = [-1] + self.safe_indices + [self.size]
+        return chain.from_iterable(range(start + 1, end) for start, end in zip(bounds, bounds[1:]))
@@ -0,0 +1,203 @@
+from .game_board import GameBoard
+
+
+class GameSession:
+    """Headless Minesweeper game built on top of a GameBoard.
+
+    Applies the same rules as the graphical game (mines placed on the
+    first click, losing on a mine, winning once every safe cell is revealed
+    and every mine flagged) without any dependency on tkinter, so games can
+    be driven from scripts and simulations.
+    """
+
+    PLAYING = 'playing'
+    WON = 'won'
+    LOST = 'lost'
+
+    def __init__(self, height, width, mines, seed=None, first_click=None):
+        """Initialize a session and start its first game.
+
+        Args:
+            height (int): Number of rows in the board
+            width (int): Number of columns in the board
+            mines (int): Total number of mines to place
+            seed (int, optional): Random seed for mine placement
+            first_click (tuple, optional): Coordinates of first click for replay
+        """
+        self.board = None
+        self.state = self.PLAYING
+        self.moves = 0
+        self.new_game(height, width, mines, seed, first_click)
+
+    def new_game(self, height, width, mines, seed=None, first_click=None):
+        """Start a new game, dropping the current one.
+
+        Args:
+            height (int): Number of rows in the board
+            width (int): Number of columns in the board
+            mines (int): Total number of mines to place
+            seed (int, optional): Random seed for mine placement
+            first_click (tuple, optional): Coordinates of first click for replay
+
+        Raises:
+            ValueError: If the board configuration is not playable
+        """
+        if height <= 0 or width <= 0 or mines <= 0:
+            raise ValueError("Les valeurs doivent être positives")
+        if mines >= height * width:
+            raise ValueError("Trop de mines pour la taille du terrain")
+
+        self.board = GameBoard(height, width, mines, seed, first_click)
+        self.state = self.PLAYING
+        self.moves = 0
+
+    @property
+    def is_over(self):
+        """bool: True once the game is won or lost."""
+        return self.state != self.PLAYING
+
+    def click(self, x, y):
+        """Reveal a cell, as a left click does.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            list: Coordinate tuples of the cells revealed by the click
+        """
+        if self.is_over:
+            return []
+        if not self.board.game_started:
+            self.board.place_mines(x, y)
+
+        index = self.board.index(x, y)
+        if self.board.flagged_mask[index] or self.board.revealed_mask[index]:
+            return []
+
+        self.moves += 1
+        revealed = self.board.reveal_cell(x, y)
+        if self.board.mine_mask[index]:
+            self.state = self.LOST
+        elif self.board.check_win():
+            self.state = self.WON
+        return revealed
+
+    def flag(self, x, y):
+        """Toggle the flag on a cell, as a right click does.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            bool: True if the flag state was changed
+        """
+        if self.is_over or not self.board.toggle_flag(x, y):
+            return False
+
+        self.moves += 1
+        if self.board.check_win():
+            self.state = self.WON
+        return True
+
+    def chord(self, x, y):
+        """Reveal the unflagged neighbours of a satisfied number.
+
+        Does nothing unless the cell is revealed and has exactly as many
+        flagged neighbours as adjacent mines.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            list: Coordinate tuples of the cells revealed by the chord
+        """
+        if self.is_over:
+            return []
+
+        board = self.board
+        revealed = board.chord(x, y)
+        if not revealed:
+            return []
+
+        self.moves += 1
+        # Mines can only be among the chorded neighbours, listed first
+        if any(board.mine_mask[board.index(rx, ry)] for rx, ry in revealed[:8]):
+            self.state = self.LOST
+        elif board.check_win():
+            self.state = self.WON
+        return revealed
+
+    def neighbours(self, x, y):
+        """List the in-bounds neighbours of a cell.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            list: Coordinate tuples of the neighbouring cells
+        """
+        return [(x + dx, y + dy)
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                if (dx or dy) and 0 <= x + dx < self.board.height and 0 <= y + dy < self.board.width]
+
+    def is_revealed(self, x, y):
+        """Check if a cell has been revealed.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            bool: True if the cell is revealed
+        """
+        return bool(self.board.revealed_mask[self.board.index(x, y)])
+
+    def is_flagged(self, x, y):
+        """Check if a cell carries a flag.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            bool: True if the cell is flagged
+        """
+        return bool(self.board.flagged_mask[self.board.index(x, y)])
+
+    def visible_number(self, x, y):
+        """Get the number a player sees on a cell.
+
+        Args:
+            x (int): Row position
+            y (int): Column position
+
+        Returns:
+            int: Adjacent mine count of a revealed cell, None for a hidden one
+        """
+        index = self.board.index(x, y)
+        if not self.board.revealed_mask[index]:
+            return None
+        return self.board.adjacent_counts[index]
+
+    def summary(self):
+        """Describe the game in a JSON-serializable form.
+
+        Returns:
+            dict: Board configuration, outcome and progress of the game
+        """
+        board = self.board
+        return {
+            'seed': board.get_seed(),
+            'width': board.width,
+            'height': board.height,
+            'mines': board.mines,
+            'first_click': board.first_click_position,
+            'result': self.state,
+            'moves': self.moves,
+            'revealed': board.revealed_mask.count(1)
+        }
@@ -0,0 +1,130 @@
+"""Optional timing instrumentation of the game and its storage.
+
+Set the DEMINEUR_INSTRUMENT environment variable to a file path to turn it
+on. Every function decorated with ``instrument`` then records its call
+count, a latency histogram and the number of cells it touched, and the
+report is written to that path as JSON when the program exits. A path
+ending in ``.prof`` writes a cProfile dump of the whole run instead, to be
+read with ``pstats`` or snakeviz.
+
+When the variable is not set, ``instrument`` returns the decorated
+function itself, so instrumented code runs exactly as before.
+
+Example:
+    DEMINEUR_INSTRUMENT=stats.json python game.py
+"""
+import functools
+import os
+import time
+
+
+OUTPUT = os.environ.get('DEMINEUR_INSTRUMENT')
+ENABLED = bool(OUTPUT)
+
+_stats = {}  # Qualified function name -> collected measurements
+
+
+def instrument(cells=None):
+    """Decorate a function to be measured when instrumentation is on.
+
+    Args:
+        cells (callable, optional): Called with the result and the arguments
+            of each call, returns the number of cells the call touched
+
+    Returns:
+        callable: Decorator returning the function unchanged when
+            instrumentation is off
+    """
+    def decorator(function):
+        if not ENABLED:
+            return function
+
+        stats = _stats.setdefault(function.__qualname__, {
+            'calls': 0,
+            'total_ns': 0,
+            'max_ns': 0,
+            'cells': 0,
+            'histogram': {}  # Power of two of the latency in microseconds -> calls
+        })
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+            stats['calls'] += 1
+            stats['total_ns'] += elapsed
+            stats['max_ns'] = max(stats['max_ns'], elapsed)
+            bucket = (elapsed // 1000).bit_length()
+            stats['histogram'][bucket] = stats['histogram'].get(bucket, 0) + 1
+            if cells is not None:
+                stats['cells'] += cells(result, *args, **kwargs)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def report():
+    """Summarize the measurements collected so far.
+
+    Returns:
+        dict: Per function call count, total, mean and max latency in
+            milliseconds, cells touched per call and latency histogram
+    """
+    summary = {}
+    for name, stats in sorted(_stats.items()):
+        calls = stats['calls']
+        if not calls:
+            continue
+        summary[name] = {
+            'calls': calls,
+            'total_ms': stats['total_ns'] / 1e6,
+            'mean_ms': stats['total_ns'] / calls / 1e6,
+            'max_ms': stats['max_ns'] / 1e6,
+            'cells_per_call': stats['cells'] / calls,
+            'histogram': {f"<{2 ** bucket}us": count
+                          for bucket, count in sorted(stats['histogram'].items())}
+        }
+    return summary
+
+
+def write_report(path):
+    """Write the measurements to a JSON file.
+
+    Args:
+        path (str): Output file path
+    """
+    import json
+
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=2)
+
+
+def _start():
+    """Set up the export of the measurements at exit."""
+    # Imported here to keep them off the startup path when instrumentation is off
+    import atexit
+    import cProfile
+    import multiprocessing
+
+    # Worker processes (no-guess board search) import the models too, only the main one reports
+    if multiprocessing.parent_process() is not None:
+        return
+
+    if OUTPUT.endswith('.prof'):
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump():
+            profiler.disable()
+            profiler.dump_stats(OUTPUT)
+
+        atexit.register(dump)
+    else:
+        atexit.register(write_report, OUTPUT)
+
+
+if ENABLED:
+    _start()
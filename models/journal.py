@@ -0,0 +1,226 @@
+"""Crash-safe autosave of a game in progress.
+
+The game is stored as a checkpoint, a full save file written by
+``save_game``, followed by a journal of the changes made since. Each
+action appends one record to the journal holding:
+- the number of moves played once the action is done;
+- the encoding of the move, as appended to the move log;
+- the cells it revealed, or the flag it set or cleared.
+
+Records are length-prefixed, so a record cut short by a crash is
+detected and dropped. Every ``CHECKPOINT_EVERY`` records, the checkpoint
+is rewritten and the journal emptied. Records carry the move count
+because a crash can happen between those two steps. When the game is
+restored, the records already covered by the checkpoint are skipped.
+"""
+import os
+from pathlib import Path
+import struct
+import time
+from .move_log import MoveLog, read_signed_varint, read_varint, write_signed_varint, write_varint
+from .savegame import load_game, restore_counters, save_game
+
+
+# Kinds of journal records
+REVEALED = 0
+FLAG_SET = 1
+FLAG_CLEARED = 2
+
+
+class GameJournal:
+    """Checkpoint and delta journal of the game being played."""
+
+    CHECKPOINT_EVERY = 200  # Journal records between two checkpoints
+
+    def __init__(self, checkpoint_file="savegame.bin", journal_file="savegame.journal", fsync_interval=1.0):
+        """Initialize the journal.
+
+        Args:
+            checkpoint_file (str): Path to the checkpoint save file
+            journal_file (str): Path to the journal of changes since the checkpoint
+            fsync_interval (float, optional): Seconds between two flushes of the
+                journal to the disk; 0 flushes every record, None leaves it to
+                the operating system
+        """
+        self.checkpoint_file = Path(checkpoint_file)
+        self.journal_file = Path(journal_file)
+        self.fsync_interval = fsync_interval
+        self.file = None
+        self.board = None
+        self.move_log = None
+        self.clock = None
+        self.records = 0
+        self.last_sync = 0.0
+
+    def exists(self):
+        """Check if an unfinished game was saved.
+
+        Returns:
+            bool: True if there is a checkpoint to restore
+        """
+        return self.checkpoint_file.exists()
+
+    def start(self, board, move_log, clock):
+        """Start journaling a game from a fresh checkpoint.
+
+        Args:
+            board (GameBoard): Board of the game, with its mines placed
+            move_log (MoveLog): Move log of the game
+            clock (callable): Returns the seconds played so far
+        """
+        self.board = board
+        self.move_log = move_log
+        self.clock = clock
+        self.checkpoint()
+
+    def checkpoint(self):
+        """Write the whole game to the checkpoint and empty the journal."""
+        if self.board is None:
+            return
+        save_game(self.checkpoint_file, self.board, self.clock(), self.move_log.to_bytes())
+        if self.file is None:
+            self.file = open(self.journal_file, 'wb')
+        else:
+            self.file.seek(0)
+            self.file.truncate()
+        self.records = 0
+
+    def record_reveal(self, move, cells):
+        """Journal the cells revealed by a move.
+
+        Args:
+            move (bytes): Encoding of the move, as returned by MoveLog.record
+            cells (list): Coordinate tuples of the revealed cells
+        """
+        if self.board is None:
+            return  # Not journaling, start() was not called
+        width = self.board.width
+        payload = self._start_record(move, REVEALED)
+        write_varint(payload, len(cells))
+        previous = 0
+        for x, y in cells:
+            index = x * width + y
+            write_signed_varint(payload, index - previous)
+            previous = index
+        self._append(payload)
+
+    def record_flag(self, move, x, y, flagged):
+        """Journal a flag toggle.
+
+        Args:
+            move (bytes): Encoding of the move, as returned by MoveLog.record
+            x (int): Cell x coordinate
+            y (int): Cell y coordinate
+            flagged (bool): True if the cell now carries a flag
+        """
+        if self.board is None:
+            return  # Not journaling, start() was not called
+        payload = self._start_record(move, FLAG_SET if flagged else FLAG_CLEARED)
+        write_varint(payload, x * self.board.width + y)
+        self._append(payload)
+
+    def _start_record(self, move, kind):
+        """Begin a record payload with the move count, the move and the record kind."""
+        payload = bytearray()
+        write_varint(payload, self.move_log.count)
+        write_varint(payload, len(move))
+        payload += move
+        payload.append(kind)
+        return payload
+
+    def _append(self, payload):
+        """Write a record to the journal, then checkpoint or sync as due."""
+        record = bytearray()
+        write_varint(record, len(payload))
+        record += payload
+        self.file.write(record)
+        self.file.flush()
+        self.records += 1
+
+        if self.records >= self.CHECKPOINT_EVERY:
+            self.checkpoint()
+        elif self.fsync_interval is not None:
+            now = time.monotonic()
+            if now - self.last_sync >= self.fsync_interval:
+                os.fsync(self.file.fileno())
+                self.last_sync = now
+
+    def restore(self):
+        """Rebuild the saved game from the checkpoint and the journal.
+
+        Every change is applied to the board buffers first and the win
+        counters are recomputed once at the end.
+
+        Returns:
+            tuple: (GameBoard, seconds played, MoveLog) of the saved game
+
+        Raises:
+            ValueError: If the checkpoint, the move log or a journal record
+                is invalid
+        """
+        try:
+            return self._restore()
+        except (IndexError, struct.error) as e:
+            raise ValueError("Sauvegarde invalide") from e
+
+    def _restore(self):
+        """Rebuild the saved game, see ``restore``."""
+        board, elapsed, moves = load_game(self.checkpoint_file)
+        moves = bytearray(moves)
+        checkpoint_count = MoveLog.resume(moves, board.width).count
+        size = board.height * board.width
+
+        data = self.journal_file.read_bytes() if self.journal_file.exists() else b''
+        position = 0
+        while position < len(data):
+            try:
+                length, start = read_varint(data, position)
+            except ValueError:
+                break
+            if start + length > len(data):
+                break  # Record cut short by a crash
+            position = start + length
+            # Parsed on its own, so that a damaged record cannot run into the next one
+            record = data[start:position]
+            count, offset = read_varint(record, 0)
+            move_length, offset = read_varint(record, offset)
+            if count <= checkpoint_count:
+                continue  # Already in the checkpoint
+            moves += record[offset:offset + move_length]
+            offset += move_length
+            kind = record[offset]
+            offset += 1
+            if kind == REVEALED:
+                cells, offset = read_varint(record, offset)
+                index = 0
+                for _ in range(cells):
+                    delta, offset = read_signed_varint(record, offset)
+                    index += delta
+                    if not 0 <= index < size:
+                        raise ValueError("Sauvegarde invalide")
+                    board.revealed_mask[index] = 1
+            elif kind in (FLAG_SET, FLAG_CLEARED):
+                index, offset = read_varint(record, offset)
+                if index >= size:
+                    raise ValueError("Sauvegarde invalide")
+                board.flagged_mask[index] = kind == FLAG_SET
+            else:
+                raise ValueError("Sauvegarde invalide")
+
+        restore_counters(board)
+        move_log = MoveLog.resume(bytes(moves), board.width)
+        return board, max(elapsed, move_log.last_time / 1000), move_log
+
+    def discard(self):
+        """Forget the saved game, once it is over."""
+        self.close()
+        self.checkpoint_file.unlink(missing_ok=True)
+        self.journal_file.unlink(missing_ok=True)
+
+    def close(self):
+        """Stop journaling, keeping the saved game."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.board = None
+        self.move_log = None
@@ -0,0 +1,169 @@
+"""Compact binary record of the moves of a game.
+
+The log starts with a format version byte. Each move is then written as
+two unsigned LEB128 varints: the milliseconds elapsed since the previous
+move shifted left by two bits with the action type in the low bits, and
+the zigzag-encoded difference between the cell index and the index of the
+previous move. Consecutive moves are usually close in time and space, so
+most moves fit in two to four bytes.
+"""
+import time
+
+
+REVEAL = 0
+FLAG = 1
+CHORD = 2
+
+FORMAT_VERSION = 1
+
+
+class MoveLog:
+    """Records the moves of a game in an in-memory buffer."""
+
+    def __init__(self, width):
+        """Initialize an empty log and start its clock.
+
+        Args:
+            width (int): Board width, to turn coordinates into cell indices
+        """
+        self.width = width
+        self.data = bytearray((FORMAT_VERSION,))
+        self.start = time.monotonic()
+        self.last_time = 0
+        self.last_index = 0
+        self.count = 0
+
+    @classmethod
+    def resume(cls, data, width):
+        """Continue recording after the moves of an existing log.
+
+        The clock picks up at the time of the last recorded move.
+
+        Args:
+            data (bytes): Encoded log, empty to start a new one
+            width (int): Board width
+
+        Returns:
+            MoveLog: Log holding the existing moves
+
+        Raises:
+            ValueError: If the log cannot be decoded
+        """
+        log = cls(width)
+        if not data:
+            return log
+        moves = decode_moves(data, width)
+        log.data = bytearray(data)
+        log.count = len(moves)
+        if moves:
+            elapsed, _, x, y = moves[-1]
+            log.last_time = elapsed
+            log.last_index = x * width + y
+            log.start -= elapsed / 1000
+        return log
+
+    def record(self, action, x, y):
+        """Append a move to the log.
+
+        Args:
+            action (int): REVEAL, FLAG or CHORD
+            x (int): Cell x coordinate
+            y (int): Cell y coordinate
+
+        Returns:
+            bytes: Encoding of the move, as appended to the log
+        """
+        now = int((time.monotonic() - self.start) * 1000)
+        index = x * self.width + y
+        end = len(self.data)
+        write_varint(self.data, (now - self.last_time) << 2 | action)
+        write_signed_varint(self.data, index - self.last_index)
+        self.last_time = now
+        self.last_index = index
+        self.count += 1
+        return bytes(self.data[end:])
+
+    def to_bytes(self):
+        """Get the encoded log.
+
+        Returns:
+            bytes: The log, to be read back with ``decode_moves``
+        """
+        return bytes(self.data)
+
+
+def decode_moves(data, width):
+    """Decode a move log.
+
+    Args:
+        data (bytes): Encoded log
+        width (int): Width of the board the log was recorded on
+
+    Returns:
+        list: (milliseconds since the start of the game, action, x, y) of each move
+
+    Raises:
+        ValueError: If the log is truncated or of an unknown format
+    """
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError("Format d'enregistrement de partie inconnu")
+
+    moves = []
+    position = 1
+    elapsed = 0
+    index = 0
+    while position < len(data):
+        timing, position = read_varint(data, position)
+        delta, position = read_signed_varint(data, position)
+        elapsed += timing >> 2
+        index += delta
+        moves.append((elapsed, timing & 3, *divmod(index, width)))
+    return moves
+
+
+def write_varint(buffer, value):
+    """Append an unsigned integer as a LEB128 varint."""
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, position):
+    """Read a LEB128 varint.
+
+    Returns:
+        tuple: (value, position after the varint)
+
+    Raises:
+        ValueError: If the data ends inside the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Enregistrement de partie tronqué")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def write_signed_varint(buffer, value):
+    """Append a signed integer as a zigzag-encoded LEB128 varint."""
+    write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def read_signed_varint(data, position):
+    """Read a zigzag-encoded LEB128 varint.
+
+    Returns:
+        tuple: (value, position after the varint)
+
+    Raises:
+        ValueError: If the data ends inside the varint
+    """
+    value, position = read_varint(data, position)
+    return (value >> 1 if not value & 1 else -((value + 1) >> 1)), position
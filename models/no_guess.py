@@ -0,0 +1,283 @@
+"""Generation of boards that can be cleared without guessing.
+
+A board is accepted when the solver, starting from a click on the board
+centre, deduces its way to every safe cell. Seeds are searched in
+parallel worker processes and accepted boards are cached on disk, so a
+game can be served from the cache instead of searching while the player
+waits.
+"""
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from .game_session import GameSession
+from .solver import Solver
+
+
+# Searches start from a random seed, so that concurrent or successive searches
+# do not scan the same seeds; the bound keeps seeds within the signed 64-bit
+# fields of the save files
+SEED_RANGE = 1 << 62
+
+
+def default_first_click(height, width):
+    """Get the cell no-guess boards are opened from.
+
+    Args:
+        height (int): Board height
+        width (int): Board width
+
+    Returns:
+        tuple: (x, y) of the board centre
+    """
+    return height // 2, width // 2
+
+
+def is_no_guess(height, width, mines, seed, first_click):
+    """Check if a board can be cleared by deduction alone.
+
+    Args:
+        height (int): Board height
+        width (int): Board width
+        mines (int): Number of mines
+        seed (int): Random seed of the board
+        first_click (tuple): Coordinates of the opening click
+
+    Returns:
+        bool: True if the solver reveals every safe cell without guessing
+    """
+    session = GameSession(height, width, mines, seed)
+    board = session.board
+    solver = Solver(board)
+    solver.update(session.click(*first_click))
+
+    while board.hidden_safe_cells:
+        solver.solve()
+        if not solver.safe:
+            if len(solver.known_mines) < board.mines:
+                return False
+            # Every mine is known, so every other hidden cell is safe
+            solver.safe.update(index for index, revealed in enumerate(board.revealed_mask)
+                               if not revealed and index not in solver.known_mines)
+        for index in list(solver.safe):
+            solver.update(board.reveal_cell(*divmod(index, width)))
+    return True
+
+
+def search_seeds(height, width, mines, first_click, seeds):
+    """Find the no-guess boards among candidate seeds.
+
+    Args:
+        height (int): Board height
+        width (int): Board width
+        mines (int): Number of mines
+        first_click (tuple): Coordinates of the opening click
+        seeds (range): Candidate seeds
+
+    Returns:
+        list: Seeds giving no-guess boards
+    """
+    return [seed for seed in seeds if is_no_guess(height, width, mines, seed, first_click)]
+
+
+class NoGuessCache:
+    """On-disk stock of no-guess boards, refilled by a process pool."""
+
+    CHUNK_SIZE = 50        # Seeds checked per worker task
+    SEARCH_SECONDS = 2.0   # Time spent searching in the foreground before giving up
+
+    def __init__(self, cache_file="no_guess_boards.json", stock=3):
+        """Initialize the cache.
+
+        Args:
+            cache_file (str): Path to the cache storage file
+            stock (int): Boards to keep ready for each configuration
+        """
+        self.cache_file = Path(cache_file)
+        self.stock = stock
+        self.lock = threading.Lock()
+        self.refilling = set()  # Configurations being searched in the background
+        self.stopping = threading.Event()  # Set when the application closes
+
+    def _load(self):
+        """Read the cached boards.
+
+        Returns:
+            list: Board dictionaries, none if the cache is missing or unreadable
+        """
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Missing, or damaged: the cache is only a stock of boards that can be searched again
+            return []
+
+    def _store(self, boards):
+        """Write the cached boards.
+
+        Args:
+            boards (list): Board dictionaries
+        """
+        temporary = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with open(temporary, 'w') as f:
+            json.dump(boards, f)
+        os.replace(temporary, self.cache_file)
+
+    def count(self, height, width, mines):
+        """Count the boards ready for a configuration.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+
+        Returns:
+            int: Number of cached boards
+        """
+        with self.lock:
+            return sum(1 for board in self._load()
+                       if (board['height'], board['width'], board['mines']) == (height, width, mines))
+
+    def take(self, height, width, mines):
+        """Remove and return a cached board for a configuration.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+
+        Returns:
+            dict: Board with seed, width, height, mines and first_click,
+                or None if the cache holds none
+        """
+        with self.lock:
+            boards = self._load()
+            for position, board in enumerate(boards):
+                if (board['height'], board['width'], board['mines']) == (height, width, mines):
+                    del boards[position]
+                    self._store(boards)
+                    board['first_click'] = tuple(board['first_click'])
+                    return board
+        return None
+
+    def add(self, height, width, mines, seeds):
+        """Store accepted boards.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+            seeds (list): Seeds of no-guess boards
+        """
+        first_click = default_first_click(height, width)
+        with self.lock:
+            boards = self._load()
+            stocked = {board['seed'] for board in boards
+                       if (board['height'], board['width'], board['mines']) == (height, width, mines)}
+            boards.extend({'seed': seed, 'width': width, 'height': height, 'mines': mines,
+                           'first_click': first_click} for seed in dict.fromkeys(seeds) if seed not in stocked)
+            self._store(boards)
+
+    def fill(self, height, width, mines, wanted=None, workers=None):
+        """Search seeds in parallel until the configuration is stocked.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+            wanted (int, optional): Boards to have ready, the cache stock by default
+            workers (int, optional): Worker processes, one per CPU by default
+        """
+        wanted = self.stock if wanted is None else wanted
+        missing = wanted - self.count(height, width, mines)
+        if missing <= 0:
+            return
+
+        # Only loaded once a search runs, they weigh on the application startup
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from multiprocessing import get_context
+
+        first_click = default_first_click(height, width)
+        workers = workers or os.cpu_count() or 1
+        next_seed = random.randrange(SEED_RANGE)
+        # Spawned workers do not inherit the state of a running Tk application
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+            pending = set()
+            while missing > 0 and not self.stopping.is_set():
+                # Keep every worker busy with a queued chunk behind the running one
+                while len(pending) < workers * 2:
+                    seeds = range(next_seed, next_seed + self.CHUNK_SIZE)
+                    next_seed += self.CHUNK_SIZE
+                    pending.add(pool.submit(search_seeds, height, width, mines, first_click, seeds))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found = future.result()[:missing]
+                    if found:
+                        self.add(height, width, mines, found)
+                        missing -= len(found)
+            for future in pending:
+                future.cancel()
+
+    def refill_in_background(self, height, width, mines):
+        """Start stocking a configuration without blocking the caller.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+        """
+        config = (height, width, mines)
+        with self.lock:
+            if self.stopping.is_set() or config in self.refilling:
+                return
+            self.refilling.add(config)
+
+        def run():
+            try:
+                self.fill(height, width, mines)
+            finally:
+                with self.lock:
+                    self.refilling.discard(config)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def stop(self):
+        """Stop the background searches, before the application exits.
+
+        Searches finish the chunks their workers are running and queue no
+        new ones.
+        """
+        self.stopping.set()
+
+    def get_board(self, height, width, mines):
+        """Get a no-guess board, searching in this process if none is cached.
+
+        The cache is topped up in the background afterwards.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+
+        Returns:
+            dict: Board with seed, width, height, mines and first_click
+
+        Raises:
+            ValueError: If no no-guess board was found for the configuration
+        """
+        board = self.take(height, width, mines)
+        if board is None:
+            first_click = default_first_click(height, width)
+            deadline = time.monotonic() + self.SEARCH_SECONDS
+            seed = random.randrange(SEED_RANGE)
+            while not is_no_guess(height, width, mines, seed, first_click):
+                if time.monotonic() >= deadline:
+                    raise ValueError("Aucune grille sans hasard trouvée pour cette configuration")
+                seed += 1
+            board = {'seed': seed, 'width': width, 'height': height, 'mines': mines,
+                     'first_click': first_click}
+        self.refill_in_background(height, width, mines)
+        return board
+
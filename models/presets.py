@@ -0,0 +1,7 @@
+"""Standard board configurations shared by the game and the headless tools."""
+
+DIFFICULTY_LEVELS = {
+    "Facile": {"height": 10, "width": 10, "mines": 10},
+    "Moyen": {"height": 16, "width": 16, "mines": 40},
+    "Difficile": {"height": 16, "width": 30, "mines": 99}
+}
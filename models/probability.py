@@ -0,0 +1,277 @@
+"""Exact mine probabilities from the visible state of a GameBoard.
+
+Every revealed number constrains how many mines its hidden neighbours
+hold. Hidden cells next to a number form the frontier; the other hidden
+cells (the interior) are unconstrained. The frontier is split into
+independent components, cells that share no number, and for each
+component the number of mine layouts is counted per number of mines with
+a forward/backward dynamic programme over its cells. Components are then
+combined with the binomial number of ways to place the remaining mines
+in the interior.
+"""
+from math import comb
+
+
+def mine_probabilities(board):
+    """Compute the exact probability that each hidden cell holds a mine.
+
+    Only the revealed mask, the numbers on revealed cells and the total
+    number of mines are used. Flags are ignored, since they may be wrong.
+
+    Args:
+        board (GameBoard): Board to read the visible state from
+
+    Returns:
+        tuple: (dict mapping the (x, y) of each frontier cell to its mine
+            probability, mine probability shared by every interior cell or
+            None if there is no interior cell)
+    """
+    width = board.width
+    revealed_mask = board.revealed_mask
+    constraints = _collect_constraints(board)
+
+    frontier = set()
+    for cells, _ in constraints:
+        frontier.update(cells)
+    hidden = len(revealed_mask) - revealed_mask.count(1)
+    interior = hidden - len(frontier)
+    # Mines can only be revealed on the losing click
+    revealed_mines = (int.from_bytes(revealed_mask, 'big') & int.from_bytes(board.mine_mask, 'big')).bit_count()
+    remaining_mines = board.mines - revealed_mines
+
+    components = [_count_component(cells, component_constraints)
+                  for cells, component_constraints in _split_components(constraints)]
+
+    # Mine count distribution of all components but one, from prefix and suffix products
+    polys = [counts for counts, _, _ in components]
+    prefix = [[1]]
+    for poly in polys:
+        prefix.append(_multiply(prefix[-1], poly))
+    suffix = [[1]]
+    for poly in reversed(polys):
+        suffix.append(_multiply(suffix[-1], poly))
+    suffix.reverse()
+    everything = prefix[-1]
+
+    def interior_ways(frontier_mines, interior_cells=interior, mines=remaining_mines):
+        interior_mines = mines - frontier_mines
+        if interior_mines < 0 or interior_mines > interior_cells:
+            return 0
+        return comb(interior_cells, interior_mines)
+
+    total = sum(ways * interior_ways(mines) for mines, ways in enumerate(everything) if ways)
+    if total == 0:
+        # The visible state is inconsistent (e.g. after a lost game)
+        return {}, None
+
+    probabilities = {}
+    for position, (_, cells, marginals) in enumerate(components):
+        others = _multiply(prefix[position], suffix[position + 1])
+        weights = [sum(ways * interior_ways(component_mines + other_mines)
+                       for other_mines, ways in enumerate(others) if ways)
+                   for component_mines in range(len(cells) + 1)]
+        for cell, cell_marginals in zip(cells, marginals):
+            numerator = sum(ways * weights[mines] for mines, ways in enumerate(cell_marginals) if ways)
+            probabilities[divmod(cell, width)] = numerator / total
+
+    interior_probability = None
+    if interior:
+        numerator = sum(ways * interior_ways(mines + 1, interior - 1, remaining_mines)
+                        for mines, ways in enumerate(everything) if ways)
+        interior_probability = numerator / total
+
+    return probabilities, interior_probability
+
+
+def safest_cell(board):
+    """Find the hidden cell least likely to hold a mine.
+
+    Args:
+        board (GameBoard): Board to read the visible state from
+
+    Returns:
+        tuple: ((x, y), probability) of the safest cell, or None if no
+            hidden cell is left
+    """
+    probabilities, interior_probability = mine_probabilities(board)
+    best = min(probabilities.items(), key=lambda item: item[1], default=None)
+    if interior_probability is not None and (best is None or interior_probability < best[1]):
+        frontier = {board.index(x, y) for x, y in probabilities}
+        for index, revealed in enumerate(board.revealed_mask):
+            if not revealed and index not in frontier:
+                return divmod(index, board.width), interior_probability
+    return best
+
+
+def _collect_constraints(board):
+    """List the constraints given by the revealed numbers.
+
+    Args:
+        board (GameBoard): Board to read the visible state from
+
+    Returns:
+        list: (tuple of hidden neighbour indices, mine count) pairs
+    """
+    width = board.width
+    height = board.height
+    revealed_mask = board.revealed_mask
+    adjacent_counts = board.adjacent_counts
+    constraints = []
+    for index, revealed in enumerate(revealed_mask):
+        if not revealed or board.mine_mask[index]:
+            continue
+        x, y = divmod(index, width)
+        cells = tuple(nx * width + ny
+                      for nx in range(max(x - 1, 0), min(x + 2, height))
+                      for ny in range(max(y - 1, 0), min(y + 2, width))
+                      if not revealed_mask[nx * width + ny])
+        if cells:
+            constraints.append((cells, adjacent_counts[index]))
+    return constraints
+
+
+def _split_components(constraints):
+    """Group the frontier into cells linked by shared constraints.
+
+    Args:
+        constraints (list): (cells, mine count) pairs
+
+    Returns:
+        list: (cells in breadth-first order, constraints) of each component
+    """
+    constraints_of = {}
+    for position, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            constraints_of.setdefault(cell, []).append(position)
+
+    components = []
+    seen = set()
+    for start in constraints_of:
+        if start in seen:
+            continue
+        # Breadth-first order keeps few constraints open at a time in the DP
+        seen.add(start)
+        order = [start]
+        used = set()
+        for cell in order:
+            for position in constraints_of[cell]:
+                if position in used:
+                    continue
+                used.add(position)
+                for other in constraints[position][0]:
+                    if other not in seen:
+                        seen.add(other)
+                        order.append(other)
+        components.append((order, [constraints[position] for position in sorted(used)]))
+    return components
+
+
+def _count_component(cells, constraints):
+    """Count the mine layouts of one frontier component.
+
+    A forward pass enumerates, cell by cell, the reachable vectors of mines
+    still needed by each constraint together with the number of ways to
+    reach them per mine count. A backward pass counts the ways to complete
+    each of those states, and combining both sides gives per-cell counts.
+
+    Args:
+        cells (list): Cell indices of the component, in processing order
+        constraints (list): (cells, mine count) pairs of the component
+
+    Returns:
+        tuple: (layouts per number of mines, cells, per-cell list of
+            layouts with that cell mined per number of mines)
+    """
+    count = len(cells)
+    position_of = {cell: position for position, cell in enumerate(cells)}
+    touching = [[] for _ in cells]  # (constraint, cells of it after this one) for each cell
+    for number, (constraint_cells, _) in enumerate(constraints):
+        positions = sorted(position_of[cell] for cell in constraint_cells)
+        for rank, position in enumerate(positions):
+            touching[position].append((number, len(positions) - rank - 1))
+
+    def step(needed, position, mined):
+        """Needed mines after deciding a cell, or None if that breaks a constraint."""
+        needed = list(needed)
+        for number, cells_after in touching[position]:
+            needed[number] -= mined
+            if not 0 <= needed[number] <= cells_after:
+                return None
+        return tuple(needed)
+
+    # Forward pass: ways to reach each state before each cell, per mines placed
+    forward = [{tuple(mines for _, mines in constraints): [1]}]
+    for position in range(count):
+        layer = {}
+        for needed, ways in forward[-1].items():
+            for mined in (0, 1):
+                following = step(needed, position, mined)
+                if following is None:
+                    continue
+                _add_into(layer.setdefault(following, []), ways, mined)
+        forward.append(layer)
+
+    # Backward pass: ways to complete each reachable state, per mines placed
+    backward = [None] * (count + 1)
+    backward[count] = {needed: [1] for needed in forward[count]}
+    for position in range(count - 1, -1, -1):
+        layer = {}
+        for needed in forward[position]:
+            completions = []
+            for mined in (0, 1):
+                following = step(needed, position, mined)
+                if following is not None and following in backward[position + 1]:
+                    _add_into(completions, backward[position + 1][following], mined)
+            if completions:
+                layer[needed] = completions
+        backward[position] = layer
+
+    start = next(iter(forward[0]))
+    totals = backward[0].get(start, [0])
+
+    marginals = []
+    for position in range(count):
+        cell_ways = []
+        for needed, ways in forward[position].items():
+            if needed not in backward[position]:
+                continue
+            following = step(needed, position, 1)
+            if following is None or following not in backward[position + 1]:
+                continue
+            _add_into(cell_ways, _multiply(ways, backward[position + 1][following]), 1)
+        marginals.append(cell_ways)
+
+    return totals, cells, marginals
+
+
+def _add_into(target, poly, shift):
+    """Add a polynomial, shifted by some degrees, into another in place.
+
+    Args:
+        target (list): Coefficients to add into
+        poly (list): Coefficients to add
+        shift (int): Degree offset of ``poly``
+    """
+    needed_length = len(poly) + shift
+    if len(target) < needed_length:
+        target.extend([0] * (needed_length - len(target)))
+    for degree, value in enumerate(poly):
+        target[degree + shift] += value
+
+
+def _multiply(first, second):
+    """Multiply two polynomials given by their coefficients.
+
+    Args:
+        first (list): Coefficients, lowest degree first
+        second (list): Coefficients, lowest degree first
+
+    Returns:
+        list: Coefficients of the product
+    """
+    product = [0] * (len(first) + len(second) - 1)
+    for i, a in enumerate(first):
+        if a:
+            for j, b in enumerate(second):
+                product[i + j] += a * b
+    return product
@@ -0,0 +1,144 @@
+"""Seekable playback of a recorded game.
+
+The moves of a move log are applied to a headless GameSession. While the
+replay is built, a compressed snapshot of the board state (a keyframe) is
+kept every ``KEYFRAME_INTERVAL`` moves, so seeking anywhere restores the
+nearest earlier keyframe and applies at most that many moves, without any
+UI work in between.
+"""
+from bisect import bisect_right
+import zlib
+from .game_session import GameSession
+from .move_log import CHORD, FLAG, REVEAL, decode_moves
+
+
+class Replay:
+    """Recorded game that can be played move by move or seeked."""
+
+    KEYFRAME_INTERVAL = 64  # Moves between two keyframes
+
+    def __init__(self, height, width, mines, seed, first_click, moves_data):
+        """Build the replay and its keyframes.
+
+        The replay is left at the start of the game.
+
+        Args:
+            height (int): Board height
+            width (int): Board width
+            mines (int): Number of mines
+            seed (int): Board seed
+            first_click (tuple): First click the mines were placed around
+            moves_data (bytes): Move log of the game
+
+        Raises:
+            ValueError: If the move log cannot be decoded
+        """
+        self.moves = decode_moves(moves_data, width)
+        self.times = [elapsed for elapsed, _, _, _ in self.moves]
+        self.session = GameSession(height, width, mines, seed, tuple(first_click))
+        self.position = 0  # Moves applied so far
+        self.keyframes = [self._snapshot()]
+
+        while self.position < len(self.moves):
+            self.step()
+            if self.position % self.KEYFRAME_INTERVAL == 0:
+                self.keyframes.append(self._snapshot())
+        self.seek(0)
+
+    @classmethod
+    def from_score(cls, score):
+        """Build the replay of a saved score.
+
+        Args:
+            score (dict): Score with seed, first_click and moves
+
+        Returns:
+            Replay: The replay of the game
+        """
+        return cls(score['height'], score['width'], score['mines'], score['seed'],
+                   score['first_click'], score['moves'])
+
+    @property
+    def length(self):
+        """int: Number of moves in the game."""
+        return len(self.moves)
+
+    @property
+    def duration(self):
+        """int: Milliseconds between the start of the game and its last move."""
+        return self.times[-1] if self.times else 0
+
+    def elapsed(self):
+        """Get the game time reached by the replay.
+
+        Returns:
+            int: Milliseconds of the last applied move, 0 at the start
+        """
+        return self.times[self.position - 1] if self.position else 0
+
+    def _snapshot(self):
+        """Capture the board state at the current position.
+
+        Returns:
+            tuple: Compressed revealed and flagged masks, counters and game state
+        """
+        board = self.session.board
+        return (zlib.compress(board.revealed_mask, 1), zlib.compress(board.flagged_mask, 1),
+                board.hidden_safe_cells, board.flagged_mines, self.session.state)
+
+    def _restore(self, keyframe_number):
+        """Put the board back in the state of a keyframe.
+
+        Args:
+            keyframe_number (int): Keyframe to restore
+        """
+        revealed, flagged, hidden_safe_cells, flagged_mines, state = self.keyframes[keyframe_number]
+        board = self.session.board
+        board.revealed_mask[:] = zlib.decompress(revealed)
+        board.flagged_mask[:] = zlib.decompress(flagged)
+        board.hidden_safe_cells = hidden_safe_cells
+        board.flagged_mines = flagged_mines
+        self.session.state = state
+        self.position = keyframe_number * self.KEYFRAME_INTERVAL
+
+    def step(self):
+        """Apply the next move.
+
+        Returns:
+            list: Coordinate tuples of the cells the move changed
+        """
+        if self.position >= len(self.moves):
+            return []
+        _, action, x, y = self.moves[self.position]
+        self.position += 1
+        if action == REVEAL:
+            return self.session.click(x, y)
+        if action == FLAG:
+            return [(x, y)] if self.session.flag(x, y) else []
+        if action == CHORD:
+            return self.session.chord(x, y)
+        return []
+
+    def seek(self, position):
+        """Move the replay to a given number of applied moves.
+
+        Going forward from the current position only applies the moves in
+        between; otherwise the nearest earlier keyframe is restored first.
+
+        Args:
+            position (int): Moves to have applied, clamped to the game length
+        """
+        position = max(0, min(position, len(self.moves)))
+        keyframe_number = position // self.KEYFRAME_INTERVAL
+        if not keyframe_number * self.KEYFRAME_INTERVAL <= self.position <= position:
+            self._restore(keyframe_number)
+        while self.position < position:
+            self.step()
+
+    def seek_time(self, elapsed):
+        """Move the replay to the state of the game at a given time.
+
+        Args:
+            elapsed (int): Milliseconds since the start of the game
+        """
+        self.seek(bisect_right(self.times, elapsed))
@@ -0,0 +1,147 @@
+"""Compact binary save files for games in progress.
+
+A save holds a fixed header (format version, board dimensions, seed, first
+click, elapsed time and length of the move log), the revealed, flagged and
+mine masks packed eight cells per byte, and the move log of the game.
+Adjacent counts are not stored: they are recomputed from the mine mask
+when the game is loaded. Version 1 saves, which have no mine mask, are
+still read by regenerating the mines from the seed and the first click.
+"""
+import os
+from pathlib import Path
+import struct
+from .game_board import GameBoard
+
+
+MAGIC = b'DMSG'
+FORMAT_VERSION = 2
+# Magic, version, height, width, mines, seed, first click x and y (-1 if none),
+# elapsed seconds, move log length
+HEADER = struct.Struct('<4sB3xIIIqiidI')
+
+# One byte per cell (0 or 1) <-> one ASCII digit per cell
+_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack_mask(mask):
+    """Pack a one-byte-per-cell mask into a bitmap.
+
+    Args:
+        mask (bytearray): Cells set to 0 or 1
+
+    Returns:
+        bytes: Bitmap of ``ceil(len(mask) / 8)`` bytes, first cell in the
+            most significant bit
+    """
+    if not mask:
+        return b''
+    padding = -len(mask) % 8
+    digits = bytes(mask).translate(_TO_DIGITS) + b'0' * padding
+    return int(digits, 2).to_bytes((len(mask) + padding) // 8, 'big')
+
+
+def unpack_mask(bitmap, size):
+    """Unpack a bitmap made by ``pack_mask``.
+
+    Args:
+        bitmap (bytes): Packed bitmap
+        size (int): Number of cells
+
+    Returns:
+        bytearray: Cells set to 0 or 1
+    """
+    if not size:
+        return bytearray()
+    digits = format(int.from_bytes(bitmap, 'big'), f'0{len(bitmap) * 8}b').encode('ascii')
+    return bytearray(digits[:size].translate(_FROM_DIGITS))
+
+
+def save_game(path, board, elapsed, moves=b''):
+    """Write a game in progress to a save file.
+
+    The file is synced and replaced atomically, so a crash while saving
+    leaves the previous save intact.
+
+    Args:
+        path (str): Save file path
+        board (GameBoard): Board to save
+        elapsed (float): Seconds played so far
+        moves (bytes): Move log of the game
+    """
+    first_x, first_y = board.first_click_position or (-1, -1)
+    path = Path(path)
+    temporary = path.with_name(path.name + '.tmp')
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, board.height, board.width, board.mines,
+                            board.seed, first_x, first_y, elapsed, len(moves)))
+        f.write(pack_mask(board.revealed_mask))
+        f.write(pack_mask(board.flagged_mask))
+        f.write(pack_mask(board.mine_mask))
+        f.write(moves)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def load_game(path):
+    """Read a game saved by ``save_game``.
+
+    Args:
+        path (str): Save file path
+
+    Returns:
+        tuple: (GameBoard in its saved state, elapsed seconds, move log bytes)
+
+    Raises:
+        ValueError: If the file is not a valid save
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError("Sauvegarde invalide")
+    (magic, version, height, width, mines, seed,
+     first_x, first_y, elapsed, moves_length) = HEADER.unpack_from(data)
+    size = height * width
+    mask_length = (size + 7) // 8
+    masks = 3 if version == FORMAT_VERSION else 2  # Version 1 saves have no mine mask
+    if magic != MAGIC or version not in (1, FORMAT_VERSION) \
+            or len(data) != HEADER.size + masks * mask_length + moves_length:
+        raise ValueError("Sauvegarde invalide")
+
+    first_click = (first_x, first_y) if first_x >= 0 else None
+    start = HEADER.size
+    if masks == 2:
+        board = GameBoard(height, width, mines, seed, first_click)
+    else:
+        board = GameBoard(height, width, mines, seed)
+        if first_click is not None:
+            # Mines are copied in one pass rather than drawn again one cell at a time
+            mine_bitmap = data[start + 2 * mask_length:start + 3 * mask_length]
+            board.mine_mask[:] = unpack_mask(mine_bitmap, size)
+            board.placed_mines = int.from_bytes(mine_bitmap, 'big').bit_count()
+            if board.placed_mines != mines:
+                raise ValueError("Sauvegarde invalide")
+            board.first_click_position = first_click
+            board._calculate_adjacent_mines()
+            board.game_started = True
+    board.revealed_mask[:] = unpack_mask(data[start:start + mask_length], size)
+    board.flagged_mask[:] = unpack_mask(data[start + mask_length:start + 2 * mask_length], size)
+    restore_counters(board)
+    moves = data[start + masks * mask_length:]
+    return board, elapsed, moves
+
+
+def restore_counters(board):
+    """Recompute the win counters of a board whose masks were overwritten.
+
+    Args:
+        board (GameBoard): Board with its mines placed
+    """
+    mines = int.from_bytes(board.mine_mask, 'big')
+    revealed = int.from_bytes(board.revealed_mask, 'big')
+    flagged = int.from_bytes(board.flagged_mask, 'big')
+    board.hidden_safe_cells = len(board.mine_mask) - board.placed_mines - (revealed & ~mines).bit_count()
+    board.flagged_mines = (flagged & mines).bit_count()
+    if board.CHECK_COUNTERS:
+        board.verify_counters()
@@ -0,0 +1,245 @@
+# score_database.py
+import json
+from pathlib import Path
+import sqlite3
+import time
+from .instrumentation import instrument
+from .score_manager import ScoreManager
+
+
+class SqliteScoreManager:
+    """Manages high scores in an SQLite database.
+
+    Scores are indexed by board configuration and time, so the best scores
+    and any page of a leaderboard are read without going through the rest
+    of the history. The best score of each player is kept up to date in a
+    table of its own. The interface is the one of ScoreManager.
+    """
+
+    COLUMNS = "name, time, width, height, mines, date, seed, first_x, first_y, moves"
+
+    def __init__(self, scores_file="high_scores.db", log_file="high_scores.jsonl",
+                 legacy_file="high_scores.json"):
+        """Initialize the score manager.
+
+        Args:
+            scores_file (str): Path to the database
+            log_file (str): Path to a JSON-lines scores log, imported when the
+                database is created
+            legacy_file (str): Path to a scores file in the former JSON list
+                format, imported when the database is created and there is no log
+        """
+        self.scores_file = Path(scores_file)
+        self.log_file = Path(log_file) if log_file else None
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+        self._connection = None
+
+    @property
+    def connection(self):
+        """Database connection, opened on first use.
+
+        Returns:
+            sqlite3.Connection: Connection to the set up database
+        """
+        if self._connection is None:
+            self._open()
+        return self._connection
+
+    def _open(self):
+        """Open the database, creating its tables and importing older scores if it is new."""
+        created = not self.scores_file.exists()
+        self._connection = sqlite3.connect(self.scores_file)
+        self._connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "id INTEGER PRIMARY KEY, name TEXT NOT NULL, time INTEGER NOT NULL, "
+                "width INTEGER NOT NULL, height INTEGER NOT NULL, mines INTEGER NOT NULL, "
+                "date TEXT NOT NULL, seed INTEGER, first_x INTEGER, first_y INTEGER, moves BLOB)")
+            # Databases created before move logs were recorded
+            columns = [row['name'] for row in self.connection.execute("PRAGMA table_info(scores)")]
+            if 'moves' not in columns:
+                self.connection.execute("ALTER TABLE scores ADD COLUMN moves BLOB")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS scores_by_config ON scores (width, height, mines, time)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS player_bests ("
+                "width INTEGER NOT NULL, height INTEGER NOT NULL, mines INTEGER NOT NULL, "
+                "name TEXT NOT NULL, time INTEGER NOT NULL, score_id INTEGER NOT NULL, "
+                "PRIMARY KEY (width, height, mines, name))")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS player_bests_by_config "
+                "ON player_bests (width, height, mines, time)")
+        if created:
+            self._import_scores()
+
+    def _import_scores(self):
+        """Copy the scores of the JSON-lines log or of the legacy file."""
+        if self.log_file and self.log_file.exists():
+            scores = ScoreManager(self.log_file, None)._read_log()
+        elif self.legacy_file and self.legacy_file.exists():
+            with open(self.legacy_file, 'r') as f:
+                scores = json.load(f)
+        else:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO scores ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._to_row(score) for score in scores))
+            # SQLite takes the bare id column from the row holding the minimum
+            self.connection.execute(
+                "INSERT OR REPLACE INTO player_bests "
+                "SELECT width, height, mines, name, MIN(time), id FROM scores "
+                "GROUP BY width, height, mines, name")
+
+    @staticmethod
+    def _to_row(score):
+        """Convert a score dictionary to database values."""
+        first_click = score.get('first_click') or (None, None)
+        return (score['name'], score['time'], score['width'], score['height'], score['mines'],
+                score['date'], score.get('seed'), first_click[0], first_click[1], score.get('moves'))
+
+    @staticmethod
+    def _to_score(row):
+        """Convert a database row to a score dictionary."""
+        score = {
+            'name': row['name'],
+            'time': row['time'],
+            'width': row['width'],
+            'height': row['height'],
+            'mines': row['mines'],
+            'date': row['date']
+        }
+        # Scores recorded before replays existed have no seed
+        if row['seed'] is not None:
+            score['seed'] = row['seed']
+        if row['first_x'] is not None:
+            score['first_click'] = [row['first_x'], row['first_y']]
+        if row['moves'] is not None:
+            score['moves'] = row['moves']
+        return score
+
+    @instrument(cells=lambda result, *args: len(result))
+    def _query(self, sql, parameters=()):
+        """Run a query and convert its rows to score dictionaries."""
+        return [self._to_score(row) for row in self.connection.execute(sql, parameters)]
+
+    @instrument()
+    def save_score(self, player_name, elapsed_time, width, height, mines, seed, first_click, moves=None):
+        """Save a new score to the database.
+
+        Args:
+            player_name (str): Name of the player
+            elapsed_time (int): Time taken to complete the game
+            width (int): Board width
+            height (int): Board height
+            mines (int): Number of mines
+            seed (int): Board seed for replay
+            first_click (tuple): First click coordinates for replay
+            moves (bytes, optional): Move log of the game, from MoveLog.to_bytes
+        """
+        new_score = {
+            'name': player_name,
+            'time': elapsed_time,
+            'width': width,
+            'height': height,
+            'mines': mines,
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'seed': seed,
+            'first_click': first_click,
+            'moves': moves or None
+        }
+        with self.connection:
+            cursor = self.connection.execute(
+                f"INSERT INTO scores ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._to_row(new_score))
+            self.connection.execute(
+                "INSERT INTO player_bests VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (width, height, mines, name) DO UPDATE "
+                "SET time = excluded.time, score_id = excluded.score_id "
+                "WHERE excluded.time < player_bests.time",
+                (width, height, mines, player_name, elapsed_time, cursor.lastrowid))
+
+    def get_high_scores(self):
+        """Retrieve all high scores.
+
+        Returns:
+            list: List of high score dictionaries, sorted by configuration and time
+        """
+        return self._query(f"SELECT {self.COLUMNS} FROM scores ORDER BY width, height, mines, time")
+
+    def configs(self):
+        """List the board configurations that have scores.
+
+        Returns:
+            list: (width, height, mines) tuples, sorted
+        """
+        # Every configuration with scores has a player best, and that table
+        # holds one row per player instead of one per score
+        return [tuple(row) for row in self.connection.execute(
+            "SELECT DISTINCT width, height, mines FROM player_bests ORDER BY width, height, mines")]
+
+    def scores_for(self, config):
+        """Get every score of a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self._query(f"SELECT {self.COLUMNS} FROM scores "
+                           "WHERE width = ? AND height = ? AND mines = ? ORDER BY time",
+                           tuple(config))
+
+    def top_n(self, config, n):
+        """Get the best scores of a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+            n (int): Maximum number of scores
+
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self.get_page(config, 0, n)
+
+    def get_page(self, config, offset, limit):
+        """Get a page of the scores of a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+            offset (int): Rank of the first score, starting from 0
+            limit (int): Maximum number of scores
+
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self._query(f"SELECT {self.COLUMNS} FROM scores "
+                           "WHERE width = ? AND height = ? AND mines = ? "
+                           "ORDER BY time LIMIT ? OFFSET ?",
+                           (*config, limit, offset))
+
+    def player_bests(self, config):
+        """Get the best score of each player on a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+
+        Returns:
+            list: One score dictionary per player, fastest first
+        """
+        return self._query("SELECT scores.* FROM player_bests "
+                           "JOIN scores ON scores.id = player_bests.score_id "
+                           "WHERE player_bests.width = ? AND player_bests.height = ? "
+                           "AND player_bests.mines = ? "
+                           "ORDER BY player_bests.time, scores.id",
+                           tuple(config))
+
+    def close(self):
+        """Close the database connection, if it was opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,29 +1,134 @@
 # score_manager.py
+import base64
 import json
+import os
 from pathlib import Path
 import time
+from .instrumentation import instrument
+
+
+def create_score_manager(backend=None):
+    """Create the score manager for a storage backend.
+
+    Args:
+        backend (str, optional): 'jsonl' or 'sqlite', read from the
+            DEMINEUR_SCORES_BACKEND environment variable by default
+
+    Returns:
+        ScoreManager or SqliteScoreManager: The score manager
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or os.environ.get('DEMINEUR_SCORES_BACKEND', 'jsonl')
+    if backend == 'jsonl':
+        return ScoreManager()
+    if backend == 'sqlite':
+        from .score_database import SqliteScoreManager
+        return SqliteScoreManager()
+    raise ValueError(f"Stockage des scores inconnu: {backend}")
 
 
 class ScoreManager:
-    """Manages high scores for the Minesweeper game."""
+    """Manages high scores for the Minesweeper game.
+
+    Scores are kept in an append-only JSON-lines log: saving a score
+    writes a single line, and ordering is done when the scores are read.
+    Once the log has grown past ``compact_size`` bytes and doubled since
+    its last compaction, it is compacted by the next save, keeping only
+    the best ``keep_per_config`` scores of each board configuration, so
+    that it stays bounded. Reads never modify the log.
 
-    def __init__(self, scores_file="high_scores.json"):
+    Parsed scores are cached in one sorted bucket per board configuration.
+    The cache is dropped by the manager's own writes and whenever the
+    modification time or size of the log changes.
+    """
+
+    def __init__(self, scores_file="high_scores.jsonl", legacy_file="high_scores.json",
+                 keep_per_config=500, compact_size=1000000):
         """Initialize the score manager.
 
         Args:
-            scores_file (str): Path to the scores storage file
+            scores_file (str): Path to the scores log
+            legacy_file (str): Path to a scores file in the former JSON list
+                format, imported into the log if the log does not exist yet
+            keep_per_config (int): Scores kept per board configuration by compaction
+            compact_size (int): Log size in bytes from which saves compact it
         """
         self.scores_file = Path(scores_file)
-        self._ensure_file_exists()
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+        self.keep_per_config = keep_per_config
+        self.compact_size = compact_size
+        self.compacted_size = 0  # Log size after the last compaction by this manager
+        self.buckets = None  # (width, height, mines) -> scores, fastest first
+        self.buckets_signature = None  # (mtime, size) of the log the buckets were read from
 
     def _ensure_file_exists(self):
-        """Create the scores file if it doesn't exist."""
+        """Create the scores log if it doesn't exist, importing legacy scores.
+
+        Called on first use rather than at construction, so creating the
+        manager does not touch the disk.
+        """
+        if self.scores_file.exists():
+            return
+
+        scores = []
+        if self.legacy_file and self.legacy_file.exists():
+            with open(self.legacy_file, 'r') as f:
+                scores = json.load(f)
+        self._write_log(scores)
+
+    @instrument(cells=lambda result, manager, scores: len(scores))
+    def _write_log(self, scores):
+        """Atomically replace the scores log.
+
+        Args:
+            scores (list): Score dictionaries, in log order
+        """
+        self.buckets = None
+        temporary = self.scores_file.with_name(self.scores_file.name + '.tmp')
+        with open(temporary, 'w') as f:
+            f.writelines(self._encode_line(score) for score in scores)
+        os.replace(temporary, self.scores_file)
+
+    @instrument(cells=lambda result, *args: len(result))
+    def _read_log(self):
+        """Read every score of the log, in log order.
+
+        Returns:
+            list: Score dictionaries
+        """
         if not self.scores_file.exists():
-            with open(self.scores_file, 'w') as f:
-                json.dump([], f)
+            return []
+
+        scores = []
+        with open(self.scores_file, 'r') as f:
+            for line in f:
+                try:
+                    score = json.loads(line)
+                    if 'moves' in score:
+                        score['moves'] = base64.b64decode(score['moves'])
+                except ValueError:
+                    # A line cut short by a crash during a save
+                    continue
+                scores.append(score)
+        return scores
 
-    def save_score(self, player_name, elapsed_time, width, height, mines, seed, first_click):
-        """Save a new score to the high scores file.
+    @staticmethod
+    def _encode_line(score):
+        """Encode a score as a log line, with its move log in base64."""
+        if 'moves' in score:
+            score = dict(score, moves=base64.b64encode(score['moves']).decode('ascii'))
+        return json.dumps(score) + '\n'
+
+    @staticmethod
+    def _sort_key(score):
+        """Order scores by board configuration and then by completion time."""
+        return score['width'], score['height'], score['mines'], score['time']
+
+    @instrument()
+    def save_score(self, player_name, elapsed_time, width, height, mines, seed, first_click, moves=None):
+        """Save a new score to the high scores log.
 
         Args:
             player_name (str): Name of the player
@@ -33,12 +138,8 @@ class ScoreManager:
             mines (int): Number of mines
             seed (int): Board seed for replay
             first_click (tuple): First click coordinates for replay
+            moves (bytes, optional): Move log of the game, from MoveLog.to_bytes
         """
-        scores = []
-        if self.scores_file.exists():
-            with open(self.scores_file, 'r') as f:
-                scores = json.load(f)
-
         new_score = {
             'name': player_name,
             'time': elapsed_time,
@@ -49,18 +150,91 @@ class ScoreManager:
             'seed': seed,
             'first_click': first_click
         }
+        if moves:
+            new_score['moves'] = moves
+
+        self._ensure_file_exists()
+        self.buckets = None
+        line = self._encode_line(new_score).encode('utf-8')
+        with open(self.scores_file, 'a+b') as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    # End the line torn by a crash, or the new score would be read as part of it
+                    line = b'\n' + line
+            f.write(line)
+
+        # Based on the log size, so the log stays bounded over runs saving a few scores each
+        size = self.scores_file.stat().st_size
+        if size >= self.compact_size and size >= 2 * self.compacted_size:
+            self.compact()
+
+    def compact(self):
+        """Rewrite the log sorted, keeping the best scores of each configuration.
 
-        scores.append(new_score)
-        # Sort scores by board configuration and then by completion time
-        scores.sort(key=lambda x: (
-            x['width'],
-            x['height'],
-            x['mines'],
-            x['time']
-        ))
+        Returns:
+            list: The scores kept, sorted by configuration and time
+        """
+        self._ensure_file_exists()
+        scores = self._sort_and_trim(self._read_log())
+        self._write_log(scores)
+        self.compacted_size = self.scores_file.stat().st_size
+        return scores
 
-        with open(self.scores_file, 'w') as f:
-            json.dump(scores, f)
+    def _sort_and_trim(self, scores):
+        """Sort scores and drop those beyond the per-configuration limit.
+
+        Args:
+            scores (list): Score dictionaries
+
+        Returns:
+            list: Sorted scores, at most ``keep_per_config`` per configuration
+        """
+        scores.sort(key=self._sort_key)
+        kept = []
+        config = None
+        count = 0
+        for score in scores:
+            score_config = (score['width'], score['height'], score['mines'])
+            if score_config != config:
+                config = score_config
+                count = 0
+            count += 1
+            if count <= self.keep_per_config:
+                kept.append(score)
+        return kept
+
+    def _log_signature(self):
+        """Get the modification time and size of the log, or None if it is missing."""
+        try:
+            stat = self.scores_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_buckets(self):
+        """Get the cached scores, reading the log again if it changed.
+
+        Scores beyond the per-configuration limit are dropped from the
+        buckets only, the log is left as it is.
+
+        Returns:
+            dict: Scores of each (width, height, mines), fastest first
+        """
+        signature = self._log_signature()
+        if signature is None:
+            self._ensure_file_exists()
+            signature = self._log_signature()
+        if self.buckets is not None and signature == self.buckets_signature:
+            return self.buckets
+
+        scores = self._sort_and_trim(self._read_log())
+        buckets = {}
+        for score in scores:
+            buckets.setdefault((score['width'], score['height'], score['mines']), []).append(score)
+        self.buckets = buckets
+        self.buckets_signature = signature
+        return buckets
 
     def get_high_scores(self):
         """Retrieve all high scores.
@@ -68,10 +242,65 @@ class ScoreManager:
         Returns:
             list: List of high score dictionaries, sorted by configuration and time
         """
-        if not self.scores_file.exists():
-            return []
+        buckets = self._get_buckets()
+        return [score for config in sorted(buckets) for score in buckets[config]]
 
-        with open(self.scores_file, 'r') as f:
-            scores = json.load(f)
+    def configs(self):
+        """List the board configurations that have scores.
+
+        Returns:
+            list: (width, height, mines) tuples, sorted
+        """
+        return sorted(self._get_buckets())
+
+    def scores_for(self, config):
+        """Get every score of a board configuration.
+
+        The list is shared with the cache and must not be modified.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
 
-        return scores
\ No newline at end of file
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self._get_buckets().get(tuple(config), [])
+
+    def top_n(self, config, n):
+        """Get the best scores of a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+            n (int): Maximum number of scores
+
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self.get_page(config, 0, n)
+
+    def get_page(self, config, offset, limit):
+        """Get a page of the scores of a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+            offset (int): Rank of the first score, starting from 0
+            limit (int): Maximum number of scores
+
+        Returns:
+            list: Score dictionaries, fastest first
+        """
+        return self.scores_for(config)[offset:offset + limit]
+
+    def player_bests(self, config):
+        """Get the best score of each player on a board configuration.
+
+        Args:
+            config (tuple): (width, height, mines) of the board
+
+        Returns:
+            list: One score dictionary per player, fastest first
+        """
+        bests = {}
+        for score in self.scores_for(config):
+            bests.setdefault(score['name'], score)
+        return list(bests.values())
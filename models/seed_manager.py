@@ -1,24 +1,105 @@
 import json
+import mmap
 from pathlib import Path
+import struct
 import time
+from .instrumentation import instrument
+
 
 class SeedManager:
-    """Manages game board seeds for replay functionality."""
+    """Manages game board seeds for replay functionality.
+
+    Recent boards are kept in a ring buffer of fixed-size binary records,
+    memory-mapped so that saving a board or reading the latest ones only
+    touches the records involved. Once the buffer is full, each save
+    overwrites the oldest record.
+    """
 
-    def __init__(self, seeds_file="board_seeds.json"):
+    MAGIC = b'DMSR'
+    # Magic, capacity, slot of the next record, number of records
+    HEADER = struct.Struct('<4sIII')
+    # Seed, date as a Unix timestamp, mines, width, height, first click x and y
+    RECORD = struct.Struct('<qqIHHHH4x')
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, seeds_file="board_seeds.bin", capacity=1000, legacy_file="board_seeds.json"):
         """Initialize the seed manager.
 
+        The seeds file is opened on first use.
+
         Args:
             seeds_file (str): Path to the seeds storage file
+            capacity (int): Boards kept when creating the file; an existing
+                file keeps its own capacity
+            legacy_file (str): Path to a seeds file in the former JSON list
+                format, imported when the storage file is created
         """
         self.seeds_file = Path(seeds_file)
-        self._ensure_file_exists()
+        self.capacity = capacity
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+        self.file = None
+        self.map = None
 
     def _ensure_file_exists(self):
-        """Create the seeds file if it doesn't exist."""
-        if not self.seeds_file.exists():
-            self.seeds_file.write_text('[]')
+        """Create an empty ring buffer file if it doesn't exist.
+
+        Returns:
+            bool: True if the file was created
+        """
+        if self.seeds_file.exists():
+            return False
+
+        with open(self.seeds_file, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.capacity, 0, 0))
+            f.truncate(self.HEADER.size + self.capacity * self.RECORD.size)
+        return True
+
+    @instrument()
+    def _open(self):
+        """Map the seeds file into memory, creating it on first use.
+
+        Raises:
+            ValueError: If the file is not a seeds ring buffer
+        """
+        if self.map is not None:
+            return
+
+        created = self._ensure_file_exists()
+        self.file = open(self.seeds_file, 'r+b')
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, self.capacity, _, _ = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"Fichier de parties invalide: {self.seeds_file}")
+
+        if created:
+            self._import_legacy_seeds()
 
+    def _import_legacy_seeds(self):
+        """Copy the boards of the former JSON seeds file, oldest first."""
+        if not self.legacy_file or not self.legacy_file.exists():
+            return
+
+        with open(self.legacy_file, 'r') as f:
+            seeds = json.load(f)
+        for seed_data in seeds:
+            date = time.mktime(time.strptime(seed_data['date'], self.DATE_FORMAT))
+            self._append(seed_data['seed'], seed_data['width'], seed_data['height'],
+                         seed_data['mines'], seed_data['first_click'], int(date))
+
+    def _append(self, seed, width, height, mines, first_click, date):
+        """Write a record in the next slot and move the head past it.
+
+        The record is written before the header, so an interrupted save
+        leaves the previous state intact.
+        """
+        _, capacity, head, count = self.HEADER.unpack_from(self.map, 0)
+        self.RECORD.pack_into(self.map, self.HEADER.size + head * self.RECORD.size,
+                              seed, date, mines, width, height, first_click[0], first_click[1])
+        self.HEADER.pack_into(self.map, 0, self.MAGIC, capacity, (head + 1) % capacity,
+                              min(count + 1, capacity))
+
+    @instrument()
     def save_seed(self, seed, width, height, mines, first_click):
         """Save a board configuration for future replay.
 
@@ -29,29 +110,10 @@ class SeedManager:
             mines (int): Number of mines
             first_click (tuple): Coordinates of first click
         """
-        seeds = []
-        if self.seeds_file.exists():
-            with open(self.seeds_file, 'r') as f:
-                seeds = json.load(f)
-
-        # Keep only the 5 most recent seeds
-        if len(seeds) >= 5:
-            seeds.pop(0)
-
-        seed_data = {
-            'seed': seed,
-            'width': width,
-            'height': height,
-            'mines': mines,
-            'first_click': first_click,
-            'date': time.strftime('%Y-%m-%d %H:%M:%S')
-        }
-
-        seeds.append(seed_data)
-
-        with open(self.seeds_file, 'w') as f:
-            json.dump(seeds, f)
+        self._open()
+        self._append(seed, width, height, mines, first_click, int(time.time()))
 
+    @instrument(cells=lambda result, *args, **kwargs: len(result))
     def get_recent_seeds(self, limit=5):
         """Get the most recent board configurations.
 
@@ -61,10 +123,29 @@ class SeedManager:
         Returns:
             list: List of recent board configurations, newest first
         """
-        if not self.seeds_file.exists():
-            return []
+        self._open()
+        _, capacity, head, count = self.HEADER.unpack_from(self.map, 0)
 
-        with open(self.seeds_file, 'r') as f:
-            seeds = json.load(f)
+        seeds = []
+        for age in range(1, min(limit, count) + 1):
+            slot = (head - age) % capacity
+            seed, date, mines, width, height, x, y = self.RECORD.unpack_from(
+                self.map, self.HEADER.size + slot * self.RECORD.size)
+            seeds.append({
+                'seed': seed,
+                'width': width,
+                'height': height,
+                'mines': mines,
+                'first_click': [x, y],
+                'date': time.strftime(self.DATE_FORMAT, time.localtime(date))
+            })
+        return seeds
 
-        return seeds[-limit:][::-1]
+    def close(self):
+        """Unmap and close the seeds file."""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
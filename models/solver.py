@@ -0,0 +1,184 @@
+class Solver:
+    """Deterministic constraint-propagation solver.
+
+    Works only from what a player can see on a GameBoard: which cells are
+    revealed and the numbers they show. Each revealed number is a
+    constraint "this many mines among my hidden neighbours". Two rules are
+    applied until nothing changes:
+
+    - single cell: if a constraint needs no more mines its hidden cells are
+      safe, if it needs as many mines as it has hidden cells they are mines;
+    - subset: if the hidden cells of constraint A are all hidden cells of
+      constraint B, the cells only B sees hold exactly ``B - A`` mines.
+
+    The solver is incremental: after ``update`` only constraints around
+    the cells that changed are examined again.
+    """
+
+    def __init__(self, board):
+        """Initialize the solver and examine the current board.
+
+        Args:
+            board (GameBoard): Board to read the visible state from
+        """
+        self.board = board
+        self.known_mines = set()  # Indices of cells deduced to be mines
+        self.safe = set()         # Indices of hidden cells deduced to be safe
+        self.dirty = set()        # Indices of revealed numbers to examine again
+        self._neighbour_cache = {}
+        self.dirty.update(index for index, revealed in enumerate(board.revealed_mask) if revealed)
+
+    def neighbours(self, index):
+        """List the in-bounds neighbours of a cell.
+
+        Args:
+            index (int): Buffer index of the cell
+
+        Returns:
+            list: Buffer indices of the neighbouring cells
+        """
+        neighbours = self._neighbour_cache.get(index)
+        if neighbours is None:
+            width = self.board.width
+            x, y = divmod(index, width)
+            neighbours = self._neighbour_cache[index] = [
+                nx * width + ny
+                for nx in range(max(x - 1, 0), min(x + 2, self.board.height))
+                for ny in range(max(y - 1, 0), min(y + 2, width))
+                if nx != x or ny != y
+            ]
+        return neighbours
+
+    def update(self, revealed):
+        """Take newly revealed cells into account.
+
+        Args:
+            revealed (list): Coordinate tuples returned by ``reveal_cell``
+        """
+        revealed_mask = self.board.revealed_mask
+        width = self.board.width
+        for x, y in revealed:
+            index = x * width + y
+            self.safe.discard(index)
+            self.dirty.add(index)
+            self.dirty.update(neighbour for neighbour in self.neighbours(index) if revealed_mask[neighbour])
+
+    def constraint(self, index):
+        """Get the constraint of a revealed number.
+
+        Args:
+            index (int): Buffer index of a revealed cell
+
+        Returns:
+            tuple: (frozenset of undecided hidden neighbours, mines still
+                needed among them)
+        """
+        revealed_mask = self.board.revealed_mask
+        needed = self.board.adjacent_counts[index]
+        unknown = []
+        for neighbour in self.neighbours(index):
+            if neighbour in self.known_mines:
+                needed -= 1
+            elif not revealed_mask[neighbour] and neighbour not in self.safe:
+                unknown.append(neighbour)
+        return frozenset(unknown), needed
+
+    def solve(self):
+        """Propagate the constraints of the dirty numbers to a fixed point.
+
+        Returns:
+            bool: True if anything new was deduced
+        """
+        revealed_mask = self.board.revealed_mask
+        progress = False
+        while self.dirty:
+            index = self.dirty.pop()
+            if not revealed_mask[index]:
+                continue
+            unknown, needed = self.constraint(index)
+            if not unknown:
+                continue
+
+            if needed == 0:
+                progress |= self._mark(unknown, mine=False)
+            elif needed == len(unknown):
+                progress |= self._mark(unknown, mine=True)
+            else:
+                progress |= self._apply_subset_rule(index, unknown, needed)
+        return progress
+
+    def _apply_subset_rule(self, index, unknown, needed):
+        """Compare a constraint with the constraints that overlap it.
+
+        Args:
+            index (int): Buffer index of the revealed number
+            unknown (frozenset): Its undecided hidden neighbours
+            needed (int): Mines still needed among them
+
+        Returns:
+            bool: True if anything new was deduced
+        """
+        revealed_mask = self.board.revealed_mask
+        # Numbers sharing a hidden cell with this one are neighbours of its hidden cells
+        others = set()
+        for cell in unknown:
+            others.update(neighbour for neighbour in self.neighbours(cell) if revealed_mask[neighbour])
+        others.discard(index)
+
+        for other in others:
+            other_unknown, other_needed = self.constraint(other)
+            if not other_unknown:
+                continue
+            if unknown <= other_unknown:
+                small, small_needed, large, large_needed = unknown, needed, other_unknown, other_needed
+            elif other_unknown <= unknown:
+                small, small_needed, large, large_needed = other_unknown, other_needed, unknown, needed
+            else:
+                continue
+
+            extra = large - small
+            extra_mines = large_needed - small_needed
+            if not extra:
+                continue
+            if extra_mines == 0:
+                return self._mark(extra, mine=False)
+            if extra_mines == len(extra):
+                return self._mark(extra, mine=True)
+        return False
+
+    def _mark(self, cells, mine):
+        """Record deduced cells and schedule their numbers for another look.
+
+        Args:
+            cells (iterable): Buffer indices of the deduced cells
+            mine (bool): True if the cells are mines, False if they are safe
+
+        Returns:
+            bool: True if any of the cells was not known yet
+        """
+        target = self.known_mines if mine else self.safe
+        revealed_mask = self.board.revealed_mask
+        progress = False
+        for cell in cells:
+            if cell in target:
+                continue
+            target.add(cell)
+            progress = True
+            self.dirty.update(neighbour for neighbour in self.neighbours(cell) if revealed_mask[neighbour])
+        return progress
+
+    def safe_cells(self):
+        """Get the hidden cells known to be safe.
+
+        Returns:
+            list: Coordinate tuples of the safe cells
+        """
+        return [divmod(index, self.board.width) for index in sorted(self.safe)]
+
+    def certain_mines(self):
+        """Get the cells known to hold a mine.
+
+        Returns:
+            list: Coordinate tuples of the mined cells
+        """
+        return [divmod(index, self.board.width) for index in sorted(self.known_mines)]
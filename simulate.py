@@ -0,0 +1,295 @@
+"""Replay or simulate Minesweeper games without a display.
+
+Examples:
+    python simulate.py --preset Difficile --games 1000 --output results.jsonl
+    python simulate.py --seeds board_seeds.bin high_scores.jsonl
+"""
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+from models.game_session import GameSession
+from models.presets import DIFFICULTY_LEVELS
+from models.probability import safest_cell
+from models.score_database import SqliteScoreManager
+from models.score_manager import ScoreManager
+from models.seed_manager import SeedManager
+from models.solver import Solver
+
+
+class RandomPlayer:
+    """Plays by clicking hidden cells at random."""
+
+    def __init__(self, session, rng):
+        """Initialize the player.
+
+        Args:
+            session (GameSession): Game being played
+            rng (random.Random): Random generator of the game
+        """
+        self.session = session
+        self.rng = rng
+
+    def observe(self, revealed):
+        """Take the cells revealed by the last move into account.
+
+        Args:
+            revealed (list): Coordinate tuples revealed by the last move
+        """
+
+    def next_move(self):
+        """Pick the next move.
+
+        Returns:
+            tuple: (action, x, y) where action is 'click' or 'flag'
+        """
+        return ('click',) + self.random_hidden_cell()
+
+    def random_hidden_cell(self, excluded=()):
+        """Pick a hidden, unflagged cell at random.
+
+        Args:
+            excluded (set): Buffer indices that must not be picked
+
+        Returns:
+            tuple: (x, y) of the cell, or None if there is none left
+        """
+        board = self.session.board
+        size = board.height * board.width
+        # Random probing is fast while many cells are hidden, fall back to a scan near the end
+        for _ in range(64):
+            index = self.rng.randrange(size)
+            if not board.revealed_mask[index] and not board.flagged_mask[index] and index not in excluded:
+                return divmod(index, board.width)
+        hidden = [index for index in range(size)
+                  if not board.revealed_mask[index] and not board.flagged_mask[index] and index not in excluded]
+        if not hidden:
+            return None
+        return divmod(self.rng.choice(hidden), board.width)
+
+
+class SolverPlayer(RandomPlayer):
+    """Plays the moves deduced by the solver, guessing at random when stuck."""
+
+    def __init__(self, session, rng):
+        super().__init__(session, rng)
+        self.solver = Solver(session.board)
+        self.guesses = 0
+
+    def observe(self, revealed):
+        self.solver.update(revealed)
+
+    def next_move(self):
+        board = self.session.board
+        self.solver.solve()
+        if self.solver.safe:
+            return ('click',) + divmod(min(self.solver.safe), board.width)
+        for index in self.solver.known_mines:
+            if not board.flagged_mask[index]:
+                return ('flag',) + divmod(index, board.width)
+
+        cell = self.random_hidden_cell(self.solver.known_mines)
+        if cell is None:
+            # Every hidden cell left is a mine
+            return ('flag',) + self.random_hidden_cell()
+        self.guesses += 1
+        return ('click',) + cell
+
+
+class ProbabilityPlayer(SolverPlayer):
+    """Plays the solver's moves and, when stuck, the cell least likely to be a mine."""
+
+    def next_move(self):
+        board = self.session.board
+        self.solver.solve()
+        if self.solver.safe or any(not board.flagged_mask[index] for index in self.solver.known_mines):
+            return super().next_move()
+
+        guess = safest_cell(board)
+        if guess is None or guess[1] >= 1:
+            return super().next_move()
+        self.guesses += 1
+        return ('click',) + guess[0]
+
+
+PLAYERS = {
+    'random': RandomPlayer,
+    'solver': SolverPlayer,
+    'probability': ProbabilityPlayer
+}
+
+
+def play_game(height, width, mines, seed, first_click, player_class):
+    """Play one game to the end.
+
+    Args:
+        height (int): Board height
+        width (int): Board width
+        mines (int): Number of mines
+        seed (int): Random seed of the board
+        first_click (tuple): First click coordinates, board centre if None
+        player_class (type): Player choosing the moves
+
+    Returns:
+        dict: Game summary with its duration in seconds
+    """
+    start = time.perf_counter()
+    if first_click is None:
+        first_click = (height // 2, width // 2)
+    session = GameSession(height, width, mines, seed)
+    player = player_class(session, random.Random(seed))
+
+    player.observe(session.click(*first_click))
+    while not session.is_over:
+        action, x, y = player.next_move()
+        if action == 'flag':
+            session.flag(x, y)
+        else:
+            player.observe(session.click(x, y))
+
+    summary = session.summary()
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def load_seed_lists(paths):
+    """Read board configurations from seed or score files.
+
+    Files are read with the manager matching their extension: the recent
+    boards ring buffer (.bin), the scores log (.jsonl) or database (.db).
+    Other files are read as JSON lists of board dictionaries, the former
+    board_seeds.json and high_scores.json format.
+
+    Args:
+        paths (list): Seed or score files, such as board_seeds.bin or high_scores.jsonl
+
+    Returns:
+        list: (height, width, mines, seed, first_click) tuples of the
+            entries that carry a seed
+
+    Raises:
+        FileNotFoundError: If a file does not exist
+    """
+    games = []
+    for path in map(Path, paths):
+        # The managers create missing files, which would hide a mistyped path
+        if not path.exists():
+            raise FileNotFoundError(f"Fichier introuvable: {path}")
+
+        if path.suffix == '.bin':
+            manager = SeedManager(path, legacy_file=None)
+            entries = manager.get_recent_seeds(limit=sys.maxsize)
+            manager.close()
+        elif path.suffix == '.jsonl':
+            entries = ScoreManager(path, None).get_high_scores()
+        elif path.suffix == '.db':
+            manager = SqliteScoreManager(path, None, None)
+            entries = manager.get_high_scores()
+            manager.close()
+        else:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+
+        for entry in entries:
+            if 'seed' not in entry:
+                continue
+            first_click = tuple(entry['first_click']) if entry.get('first_click') else None
+            games.append((entry['height'], entry['width'], entry['mines'], entry['seed'], first_click))
+    return games
+
+
+def board_size(value):
+    """Parse a HEIGHTxWIDTH board size argument.
+
+    Args:
+        value (str): Command line value, such as "16x30"
+
+    Returns:
+        tuple: (height, width)
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not two positive integers
+    """
+    parts = value.lower().split('x')
+    if len(parts) != 2 or not all(part.strip().isdigit() for part in parts):
+        raise argparse.ArgumentTypeError(f"expected HEIGHTxWIDTH, such as 16x30, got {value!r}")
+    height, width = (int(part) for part in parts)
+    if height <= 0 or width <= 0:
+        raise argparse.ArgumentTypeError(f"board dimensions must be positive, got {value!r}")
+    return height, width
+
+
+def parse_args(argv):
+    """Parse the command line.
+
+    Args:
+        argv (list): Command line arguments, without the program name
+
+    Returns:
+        argparse.Namespace: Parsed options, with the height, width and mines
+            of simulated games resolved from the preset and its overrides
+    """
+    parser = argparse.ArgumentParser(description="Replay or simulate Minesweeper games without a display.")
+    parser.add_argument('--seeds', nargs='+', metavar='FILE',
+                        help="replay the boards listed in these seed or score files")
+    parser.add_argument('--preset', choices=sorted(DIFFICULTY_LEVELS), default='Facile',
+                        help="board configuration of simulated games (default: Facile)")
+    parser.add_argument('--size', metavar='HEIGHTxWIDTH', type=board_size,
+                        help="custom board size, overrides the preset")
+    parser.add_argument('--mines', type=int, help="custom number of mines, overrides the preset")
+    parser.add_argument('--games', type=int, default=1000, help="number of simulated games (default: 1000)")
+    parser.add_argument('--start-seed', type=int, default=0, help="seed of the first simulated game")
+    parser.add_argument('--player', choices=sorted(PLAYERS), default='solver',
+                        help="how moves are chosen (default: solver)")
+    parser.add_argument('--output', metavar='FILE', help="write one JSON line per game to this file")
+    args = parser.parse_args(argv)
+
+    # Check the configuration now rather than failing once games are running
+    settings = DIFFICULTY_LEVELS[args.preset]
+    args.height, args.width = args.size or (settings['height'], settings['width'])
+    if args.mines is None:
+        args.mines = settings['mines']
+    if not args.seeds:
+        if args.mines <= 0:
+            parser.error(f"--mines must be positive, got {args.mines}")
+        if args.mines >= args.height * args.width:
+            parser.error(f"--mines must be below the {args.height * args.width} cells of the board")
+    return args
+
+
+def main(argv=None):
+    """Run the simulations described by the command line."""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.seeds:
+        try:
+            games = load_seed_lists(args.seeds)
+        except (OSError, ValueError) as e:
+            sys.exit(str(e))
+    else:
+        games = [(args.height, args.width, args.mines, seed, None)
+                 for seed in range(args.start_seed, args.start_seed + args.games)]
+
+    player_class = PLAYERS[args.player]
+    output = open(args.output, 'w') if args.output else None
+    wins = 0
+    start = time.perf_counter()
+    try:
+        for height, width, mines, seed, first_click in games:
+            summary = play_game(height, width, mines, seed, first_click, player_class)
+            wins += summary['result'] == GameSession.WON
+            if output:
+                output.write(json.dumps(summary) + '\n')
+    finally:
+        if output:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(games)} games in {elapsed:.2f}s "
+          f"({len(games) / elapsed if elapsed else 0:.0f} games/s), {wins} won", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
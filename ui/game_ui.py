@@ -1,13 +1,22 @@
 import tkinter as tk
 from tkinter import ttk
-from .score_dialog import ScoreDialog
+from models.instrumentation import instrument
 
 
 class GameUI:
     """Manages the game board user interface.
 
     This class handles the creation and management of the Minesweeper game board interface,
-    including cell buttons, timer display, and game controls.
+    including the cell grid, timer display, and game controls.
+
+    The grid is drawn on a single scrollable, zoomable canvas. Only the
+    cells inside the visible viewport have canvas items: they are created
+    as cells scroll into view and deleted as they leave it, so the cost of
+    the view depends on the screen size rather than on the board size.
+
+    Cell updates are not applied immediately: changed cells are collected
+    in a dirty set that is flushed once per frame from an idle callback,
+    with one Tcl call per group of cells sharing the same new look.
     """
 
     # Color mapping for cell numbers (indicating adjacent mines)
@@ -22,7 +31,16 @@ class GameUI:
         8: '#808080'  # Grey
     }
 
-    def __init__(self, root, game_board, on_cell_click, on_right_click, on_return_to_menu):
+    CELL_SIZE = 26                  # Default side of a cell in pixels
+    MIN_CELL_SIZE = 8               # Smallest zoom level
+    MAX_CELL_SIZE = 48              # Largest zoom level
+    MAX_VIEWPORT = (940, 660)       # Largest visible grid area (width, height) in pixels
+
+    # Tk event state bits of a held mouse button
+    BUTTON1_MASK = 0x100
+    BUTTON3_MASK = 0x400
+
+    def __init__(self, root, game_board, on_cell_click, on_right_click, on_return_to_menu, on_chord=None):
         """Initialize the game UI.
 
         Args:
@@ -31,21 +49,37 @@ class GameUI:
             on_cell_click (callable): Callback for left-click cell events
             on_right_click (callable): Callback for right-click cell events
             on_return_to_menu (callable): Callback for return to menu button
+            on_chord (callable, optional): Callback for middle-click or
+                both-button click cell events
         """
         self.root = root
         self.game_board = game_board
         self.on_cell_click = on_cell_click
         self.on_right_click = on_right_click
         self.on_return_to_menu = on_return_to_menu
+        self.on_chord = on_chord or (lambda x, y: None)
         self.frame = None
         self.timer_label = None
+        self.canvas = None
+        self.h_scrollbar = None
+        self.v_scrollbar = None
+        self.cell_size = self.CELL_SIZE
+        self.items = {}              # Buffer index -> (rectangle id, text id) of drawn cells
+        self.drawn_styles = {}       # Buffer index -> style tuple currently shown by drawn cells
+        self.visible = (0, 0, 0, 0)  # Drawn cell range: first row, end row, first column, end column
+        self.refresh_pending = False
+        self.dirty = set()           # Buffer indices of cells waiting for a redraw
+        self.flush_pending = False
+        self.disabled = False
+        self.mines_shown = False
         self.create_game_board()
 
+    @instrument()
     def create_game_board(self):
         """Create and initialize the game board UI elements.
 
         Sets up the main game frame, timer display, seed display,
-        cell buttons grid, and return to menu button.
+        scrollable cell grid canvas, and return to menu button.
         """
         # Create frame to center the grid
         self.frame = ttk.Frame(self.root, padding="10")
@@ -53,7 +87,7 @@ class GameUI:
 
         # Create timer and seed display
         info_frame = ttk.Frame(self.frame)
-        info_frame.grid(row=0, column=0, columnspan=self.game_board.width, pady=5)
+        info_frame.grid(row=0, column=0, columnspan=2, pady=5)
 
         self.timer_label = ttk.Label(info_frame, text="Time: 0s")
         self.timer_label.pack(side=tk.LEFT, padx=5)
@@ -61,81 +95,308 @@ class GameUI:
         seed_label = ttk.Label(info_frame, text=f"Seed: {self.game_board.get_seed()}")
         seed_label.pack(side=tk.LEFT, padx=5)
 
-        # Define cell button style
-        style = {'width': 2, 'height': 1, 'font': ('TkDefaultFont', 10, 'bold')}
-
-        # Create cell buttons grid
-        for x in range(self.game_board.height):
-            for y in range(self.game_board.width):
-                cell = self.game_board.cells[x][y]
-                cell.button = tk.Button(
-                    self.frame,
-                    **style,
-                    text="",
-                    bg='lightgray',
-                    relief=tk.RAISED
-                )
-                cell.button.grid(row=x + 1, column=y)
-                cell.button.bind('<Button-1>', lambda e, x=x, y=y: self.on_cell_click(x, y))
-                cell.button.bind('<Button-3>', lambda e, x=x, y=y: self.on_right_click(x, y))
+        # Create cell grid canvas with its scrollbars
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, bg='gray')
+        self.canvas.grid(row=1, column=0)
+        self.h_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.v_scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=self._on_x_scroll, yscrollcommand=self._on_y_scroll)
+        self._resize_canvas()
+
+        # Pressing one button while the other is held chords, like the middle button
+        self.canvas.bind('<Button-1>', lambda e: self._dispatch_click(
+            e, self.on_chord if e.state & self.BUTTON3_MASK else self.on_cell_click))
+        self.canvas.bind('<Button-3>', lambda e: self._dispatch_click(
+            e, self.on_chord if e.state & self.BUTTON1_MASK else self.on_right_click))
+        self.canvas.bind('<Button-2>', lambda e: self._dispatch_click(e, self.on_chord))
+        self.canvas.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._on_mouse_wheel(e, horizontal=True))
+        self.canvas.bind('<Control-MouseWheel>', lambda e: self.zoom(1 if e.delta > 0 else -1))
+        self.canvas.bind('<Button-4>', lambda e: self.canvas.yview_scroll(-3, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.canvas.yview_scroll(3, 'units'))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self.canvas.xview_scroll(-3, 'units'))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self.canvas.xview_scroll(3, 'units'))
+        self.canvas.bind('<Control-Button-4>', lambda e: self.zoom(1))
+        self.canvas.bind('<Control-Button-5>', lambda e: self.zoom(-1))
 
         # Create centered return to menu button
         back_button = ttk.Button(self.frame, text="Return to Menu", command=self.on_return_to_menu)
-        back_button.grid(row=self.game_board.height + 1, column=0, columnspan=self.game_board.width, pady=10)
+        back_button.grid(row=3, column=0, columnspan=2, pady=10)
+
+        self.refresh_viewport()
+
+    def _resize_canvas(self):
+        """Fit the canvas to the board at the current zoom, within the viewport limits."""
+        board_width = self.game_board.width * self.cell_size
+        board_height = self.game_board.height * self.cell_size
+        max_width, max_height = self.MAX_VIEWPORT
+        self.canvas.configure(
+            width=min(board_width, max_width),
+            height=min(board_height, max_height),
+            scrollregion=(0, 0, board_width, board_height),
+            xscrollincrement=self.cell_size,
+            yscrollincrement=self.cell_size
+        )
+
+        # Only show the scrollbars the board actually needs
+        if board_width > max_width:
+            self.h_scrollbar.grid(row=2, column=0, sticky=(tk.W, tk.E))
+        else:
+            self.h_scrollbar.grid_remove()
+        if board_height > max_height:
+            self.v_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        else:
+            self.v_scrollbar.grid_remove()
+
+    def _on_x_scroll(self, first, last):
+        """Keep the horizontal scrollbar in sync and redraw the viewport."""
+        self.h_scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_y_scroll(self, first, last):
+        """Keep the vertical scrollbar in sync and redraw the viewport."""
+        self.v_scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_mouse_wheel(self, event, horizontal=False):
+        """Scroll the grid with the mouse wheel.
+
+        Args:
+            event (tk.Event): Mouse wheel event
+            horizontal (bool): Scroll sideways instead of up and down
+        """
+        steps = -3 if event.delta > 0 else 3
+        if horizontal:
+            self.canvas.xview_scroll(steps, 'units')
+        else:
+            self.canvas.yview_scroll(steps, 'units')
+
+    def zoom(self, direction):
+        """Change the cell size, keeping the same part of the board in view.
+
+        Args:
+            direction (int): 1 to zoom in, -1 to zoom out
+        """
+        factor = 1.25 if direction > 0 else 0.8
+        cell_size = max(self.MIN_CELL_SIZE, min(self.MAX_CELL_SIZE, round(self.cell_size * factor)))
+        if cell_size == self.cell_size:
+            return
+
+        left = self.canvas.xview()[0]
+        top = self.canvas.yview()[0]
+        self.cell_size = cell_size
+        self.canvas.delete(tk.ALL)
+        self.items.clear()
+        self.drawn_styles.clear()
+        self.visible = (0, 0, 0, 0)
+        self._resize_canvas()
+        self.canvas.xview_moveto(left)
+        self.canvas.yview_moveto(top)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Redraw the viewport once the pending scroll events are handled."""
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.canvas.after_idle(self.refresh_viewport)
+
+    def refresh_viewport(self):
+        """Create the items of cells entering the view and delete those leaving it."""
+        self.refresh_pending = False
+        if not self.canvas.winfo_exists():
+            return
+        size = self.cell_size
+        left = int(self.canvas.canvasx(0))
+        top = int(self.canvas.canvasy(0))
+        view_width = int(self.canvas.cget('width'))
+        view_height = int(self.canvas.cget('height'))
+
+        first_row = max(top // size, 0)
+        end_row = min((top + view_height) // size + 1, self.game_board.height)
+        first_column = max(left // size, 0)
+        end_column = min((left + view_width) // size + 1, self.game_board.width)
+        visible = (first_row, end_row, first_column, end_column)
+        if visible == self.visible:
+            return
+
+        old_first_row, old_end_row, old_first_column, old_end_column = self.visible
+        width = self.game_board.width
+
+        # Drop the cells that scrolled out of view
+        delete = self.canvas.delete
+        for x in range(old_first_row, old_end_row):
+            row_visible = first_row <= x < end_row
+            for y in range(old_first_column, old_end_column):
+                if not (row_visible and first_column <= y < end_column):
+                    delete(*self.items.pop(x * width + y))
+                    del self.drawn_styles[x * width + y]
+
+        # Draw the cells that scrolled into view
+        for x in range(first_row, end_row):
+            row_drawn = old_first_row <= x < old_end_row
+            for y in range(first_column, end_column):
+                if not (row_drawn and old_first_column <= y < old_end_column):
+                    self._draw_cell(x, y)
+
+        self.visible = visible
+
+    def _cell_style(self, index):
+        """Get how a cell should look given the board state.
+
+        Args:
+            index (int): Buffer index of the cell
 
+        Returns:
+            tuple: (background color, text, text color)
+        """
+        board = self.game_board
+        if self.mines_shown and board.mine_mask[index]:
+            return 'red', '💣', 'black'
+        if board.revealed_mask[index]:
+            count = board.adjacent_counts[index]
+            if count > 0:
+                return 'white', str(count), self.NUMBER_COLORS.get(count, 'black')
+            return 'white', '', 'black'
+        if board.flagged_mask[index]:
+            return 'light blue', '🚩', 'black'
+        return 'lightgray', '', 'black'
+
+    def _draw_cell(self, x, y):
+        """Create the canvas items of a cell scrolling into view.
+
+        Args:
+            x (int): Row position of the cell
+            y (int): Column position of the cell
+        """
+        size = self.cell_size
+        top = x * size
+        left = y * size
+        index = x * self.game_board.width + y
+        style = self._cell_style(index)
+        background, text, color = style
+        rectangle = self.canvas.create_rectangle(
+            left, top, left + size, top + size,
+            fill=background, outline='gray'
+        )
+        label = self.canvas.create_text(
+            left + size // 2, top + size // 2,
+            text=text, fill=color, font=('TkDefaultFont', max(size * 2 // 5, 6), 'bold')
+        )
+        self.items[index] = (rectangle, label)
+        self.drawn_styles[index] = style
+
+    def cell_at(self, event_x, event_y):
+        """Find the cell under a point of the canvas.
+
+        Args:
+            event_x (int): Horizontal position in window pixels
+            event_y (int): Vertical position in window pixels
+
+        Returns:
+            tuple: (row, column) of the cell, or None outside the grid
+        """
+        x = int(self.canvas.canvasy(event_y)) // self.cell_size
+        y = int(self.canvas.canvasx(event_x)) // self.cell_size
+        if 0 <= x < self.game_board.height and 0 <= y < self.game_board.width:
+            return x, y
+        return None
+
+    def _dispatch_click(self, event, callback):
+        """Forward a canvas click to a cell callback.
+
+        Args:
+            event (tk.Event): Mouse event from the canvas
+            callback (callable): Cell callback taking (x, y)
+        """
+        if self.disabled:
+            return
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            callback(*cell)
+
+    @instrument(cells=lambda *args: 1)
     def update_cell(self, x, y):
-        """Update the visual appearance of a cell based on its current state.
+        """Schedule a redraw of a cell from its current state.
 
         Args:
             x (int): Row position of the cell
             y (int): Column position of the cell
         """
-        cell = self.game_board.cells[x][y]
-        if cell.is_revealed:
-            # Configure revealed cell appearance
-            cell.button.config(
-                relief=tk.SUNKEN,
-                bg='white',
-                state='disabled'
-            )
-            if cell.adjacent_mines > 0:
-                cell.button.config(
-                    text=str(cell.adjacent_mines),
-                    fg=self.NUMBER_COLORS.get(cell.adjacent_mines, 'black'),
-                    disabledforeground=self.NUMBER_COLORS.get(cell.adjacent_mines, 'black')
-                )
-        elif cell.is_flagged:
-            # Configure flagged cell appearance
-            cell.button.config(
-                text='🚩',
-                bg='light blue',
-                relief=tk.RAISED
-            )
-        else:
-            # Configure default cell appearance
-            cell.button.config(
-                text='',
-                bg='lightgray',
-                relief=tk.RAISED
-            )
+        self.dirty.add(x * self.game_board.width + y)
+        self._schedule_flush()
+
+    @instrument(cells=lambda result, ui, cells: len(cells))
+    def update_cells(self, cells):
+        """Schedule a redraw of several cells from their current state.
+
+        Args:
+            cells (list): Coordinate tuples of the cells to redraw
+        """
+        width = self.game_board.width
+        self.dirty.update(x * width + y for x, y in cells)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Flush the dirty cells once the current events are handled."""
+        if not self.flush_pending:
+            self.flush_pending = True
+            self.canvas.after_idle(self.flush_updates)
+
+    def flush_updates(self):
+        """Redraw the dirty cells with as few Tk operations as possible.
+
+        Cells outside the viewport and cells whose look did not change are
+        skipped; off-screen cells pick up their state when they are drawn.
+        The others are grouped by new look and each group is configured by
+        a single Tcl loop.
+        """
+        self.flush_pending = False
+        dirty, self.dirty = self.dirty, set()
+        if not self.canvas.winfo_exists():
+            return
+
+        groups = {}
+        for index in dirty:
+            items = self.items.get(index)
+            if items is None:
+                continue
+            style = self._cell_style(index)
+            if style == self.drawn_styles[index]:
+                continue
+            self.drawn_styles[index] = style
+            groups.setdefault(style, []).append(items)
+
+        canvas = str(self.canvas)
+        call = self.canvas.tk.call
+        for (background, text, color), items in groups.items():
+            rectangles = tuple(rectangle for rectangle, _ in items)
+            labels = tuple(label for _, label in items)
+            call('foreach', 'item', rectangles,
+                 f'{canvas} itemconfigure $item -fill {{{background}}}')
+            call('foreach', 'item', labels,
+                 f'{canvas} itemconfigure $item -text {{{text}}} -fill {{{color}}}')
+
+    def redraw(self):
+        """Redraw every drawn cell from the board state in one pass.
+
+        Used after the board state changed wholesale, e.g. after seeking
+        in a replay, instead of scheduling each changed cell.
+        """
+        self.dirty.update(self.items)
+        self.flush_updates()
 
     def show_mines(self):
         """Reveal all mines on the board (game over state).
 
-        Updates the appearance of mine cells to show bomb icons
-        and disables all cell buttons.
+        Updates the appearance of the visible mine cells to show bomb icons
+        and stops the grid from reacting to clicks; mines outside the view
+        are drawn as bombs when scrolled into view.
         """
-        for row in self.game_board.cells:
-            for cell in row:
-                if cell.is_mine:
-                    cell.button.config(
-                        text='💣',
-                        bg='red',
-                        relief=tk.SUNKEN,
-                        state='disabled'
-                    )
-                else:
-                    cell.button.config(state='disabled')
+        self.mines_shown = True
+        self.disabled = True
+        mine_mask = self.game_board.mine_mask
+        self.dirty.update(index for index in self.items if mine_mask[index])
+        self.flush_updates()
 
     def update_timer(self, elapsed_time):
         """Update the timer display with current elapsed time.
@@ -149,4 +410,4 @@ class GameUI:
     def destroy(self):
         """Clean up and remove all UI elements."""
         if self.frame:
-            self.frame.destroy()
\ No newline at end of file
+            self.frame.destroy()
@@ -1,25 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from .replay_dialog import ReplayDialog
+from models.presets import DIFFICULTY_LEVELS
 
 
 class MenuUI:
     """Main menu interface for the Minesweeper game."""
 
-    DIFFICULTY_LEVELS = {
-        "Facile": {"height": 10, "width": 10, "mines": 10},
-        "Moyen": {"height": 16, "width": 16, "mines": 40},
-        "Difficile": {"height": 16, "width": 30, "mines": 99}
-    }
+    DIFFICULTY_LEVELS = DIFFICULTY_LEVELS
 
-    # Personalised mode limits
+    # Personalised mode limits (the board view only draws the visible cells)
     CUSTOM_LIMITS = {
-        "height": {"min": 5, "max": 30},
-        "width": {"min": 5, "max": 35},
-        "mines": {"min": 1, "max": 500}
+        "height": {"min": 5, "max": 1000},
+        "width": {"min": 5, "max": 1000},
+        "mines": {"min": 1, "max": 500000}
     }
 
-    def __init__(self, root, on_start_game, on_show_scores, on_replay_game):
+    def __init__(self, root, on_start_game, on_show_scores, on_replay_game, no_guess_cache=None,
+                 on_resume_game=None):
         """Initialize the menu UI.
 
         Args:
@@ -27,17 +24,25 @@ class MenuUI:
             on_start_game: Callback for starting a new game
             on_show_scores: Callback for showing high scores
             on_replay_game: Callback for replaying a previous game
+            no_guess_cache (NoGuessCache, optional): Source of no-guess boards,
+                the no-guess option is hidden without it
+            on_resume_game (callable, optional): Callback for resuming a saved
+                game, the resume button is hidden without it
         """
         self.root = root
         self.on_start_game = on_start_game
         self.on_show_scores = on_show_scores
         self.on_replay_game = on_replay_game
+        self.no_guess_cache = no_guess_cache
+        self.on_resume_game = on_resume_game
         self.frame = None
         self.custom_frame = None
         self.height_var = tk.StringVar(value="10")
         self.width_var = tk.StringVar(value="10")
         self.mines_var = tk.StringVar(value="10")
         self.difficulty_var = tk.StringVar(value="Facile")
+        self.no_guess_var = tk.BooleanVar(value=False)
+        self.no_guess_button = None
         self.create_menu()
 
     def create_menu(self):
@@ -62,6 +67,16 @@ class MenuUI:
                 command=self.toggle_custom_options
             ).grid(row=i, column=0, pady=5, padx=10, sticky=tk.W)
 
+        # No-guess mode for competitive play
+        if self.no_guess_cache:
+            self.no_guess_button = ttk.Checkbutton(
+                diff_frame,
+                text="Sans hasard (résoluble sans deviner)",
+                variable=self.no_guess_var,
+                command=self.prepare_no_guess_boards
+            )
+            self.no_guess_button.grid(row=4, column=0, pady=5, padx=10, sticky=tk.W)
+
         # Custom game options
         self.custom_frame = ttk.LabelFrame(self.frame, text="Options personnalisées", padding="10")
         self.custom_frame.grid(row=2, column=0, columnspan=2, pady=10, sticky=(tk.W, tk.E))
@@ -104,8 +119,11 @@ class MenuUI:
             row=0, column=1, pady=5, padx=5)
         ttk.Button(buttons_frame, text="Meilleurs scores", command=self.on_show_scores).grid(
             row=0, column=2, pady=5, padx=5)
+        if self.on_resume_game:
+            ttk.Button(buttons_frame, text="Reprendre", command=self.on_resume_game).grid(
+                row=1, column=0, columnspan=3, pady=5)
         ttk.Button(buttons_frame, text="Quitter", command=self.quit_game, style="Quit.TButton").grid(
-            row=1, column=0, columnspan=3, pady=10)
+            row=2, column=0, columnspan=3, pady=10)
 
         # Quit button style
         style = ttk.Style()
@@ -147,11 +165,30 @@ class MenuUI:
         Displays custom options frame when 'Custom' difficulty is selected,
         hides it otherwise.
         """
-        if self.difficulty_var.get() == "Personnalisé":
+        custom = self.difficulty_var.get() == "Personnalisé"
+        if custom:
             self.custom_frame.grid()
         else:
             self.custom_frame.grid_remove()
 
+        # Searching large custom boards would take minutes, no-guess is for the presets only
+        if self.no_guess_button:
+            if custom:
+                self.no_guess_var.set(False)
+            self.no_guess_button.configure(state=tk.DISABLED if custom else tk.NORMAL)
+        self.prepare_no_guess_boards()
+
+    def prepare_no_guess_boards(self):
+        """Stock no-guess boards for the selected preset in the background.
+
+        Runs while the player is still in the menu, so that starting the
+        game can be served straight from the cache.
+        """
+        difficulty = self.difficulty_var.get()
+        if self.no_guess_var.get() and difficulty in self.DIFFICULTY_LEVELS:
+            settings = self.DIFFICULTY_LEVELS[difficulty]
+            self.no_guess_cache.refill_in_background(settings["height"], settings["width"], settings["mines"])
+
     def start_game(self):
         """Start a new game with selected options.
 
@@ -175,7 +212,14 @@ class MenuUI:
                 width = settings["width"]
                 mines = settings["mines"]
 
-            self.on_start_game(height, width, mines)
+            if self.no_guess_var.get():
+                if difficulty not in self.DIFFICULTY_LEVELS:
+                    raise ValueError("Le mode sans hasard n'est disponible que pour les niveaux prédéfinis")
+                board = self.no_guess_cache.get_board(height, width, mines)
+                self.on_start_game(height, width, mines, board['seed'], board['first_click'],
+                                   reveal_first_click=True)
+            else:
+                self.on_start_game(height, width, mines)
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
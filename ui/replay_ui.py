@@ -0,0 +1,126 @@
+# replay_ui.py
+import tkinter as tk
+from tkinter import ttk
+from .game_ui import GameUI
+
+
+class ReplayUI:
+    """Plays back a recorded game on a read-only game board view.
+
+    Moves are shown one at a time at the recorded pace, scaled by the
+    chosen speed. Dragging the position slider seeks the replay and
+    redraws the view once.
+    """
+
+    SPEEDS = ("0.5", "1", "2", "4", "8", "16")
+
+    def __init__(self, root, replay, on_return_to_menu):
+        """Initialize the replay player.
+
+        Args:
+            root (tk.Tk): Tkinter root window
+            replay (Replay): Recorded game to play back
+            on_return_to_menu (callable): Callback for return to menu button
+        """
+        self.root = root
+        self.replay = replay
+        self.playing = False
+        self.step_id = None
+        self.updating_slider = False
+
+        self.game_ui = GameUI(root, replay.session.board, lambda x, y: None, lambda x, y: None,
+                              on_return_to_menu)
+        self.game_ui.disabled = True
+
+        # Playback controls, below the board
+        controls = ttk.Frame(self.game_ui.frame)
+        controls.grid(row=4, column=0, columnspan=2, pady=5)
+
+        self.play_button = ttk.Button(controls, text="Lecture", width=8, command=self.toggle_playing)
+        self.play_button.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(controls, text="Vitesse:").pack(side=tk.LEFT)
+        self.speed_var = tk.StringVar(value="1")
+        ttk.Combobox(controls, textvariable=self.speed_var, values=self.SPEEDS,
+                     width=4, state="readonly").pack(side=tk.LEFT, padx=5)
+
+        self.position_var = tk.DoubleVar(value=0)
+        ttk.Scale(controls, from_=0, to=max(replay.length, 1), orient=tk.HORIZONTAL, length=400,
+                  variable=self.position_var, command=self._on_slider).pack(side=tk.LEFT, padx=5)
+
+        self.position_label = ttk.Label(controls, width=18)
+        self.position_label.pack(side=tk.LEFT, padx=5)
+        self._show_position()
+
+    def toggle_playing(self):
+        """Start or pause the playback."""
+        if self.playing:
+            self.pause()
+            return
+        if self.replay.position >= self.replay.length:
+            self.seek(0)
+        self.playing = True
+        self.play_button.configure(text="Pause")
+        self._schedule_step()
+
+    def pause(self):
+        """Stop the playback at the current move."""
+        self.playing = False
+        self.play_button.configure(text="Lecture")
+        if self.step_id:
+            self.root.after_cancel(self.step_id)
+            self.step_id = None
+
+    def _schedule_step(self):
+        """Wait for the recorded delay before the next move, scaled by the speed."""
+        replay = self.replay
+        if replay.position >= replay.length:
+            self.pause()
+            return
+        delay = replay.times[replay.position] - replay.elapsed()
+        self.step_id = self.root.after(int(delay / float(self.speed_var.get())), self._play_step)
+
+    def _play_step(self):
+        """Show the next move and schedule the following one."""
+        self.step_id = None
+        self.game_ui.update_cells(self.replay.step())
+        self._sync_mines()
+        self._show_position()
+        self._schedule_step()
+
+    def _on_slider(self, value):
+        """Seek the replay to the move picked on the slider."""
+        if not self.updating_slider:
+            self.seek(int(float(value)))
+
+    def seek(self, position):
+        """Jump to a given number of applied moves and redraw the board once.
+
+        Args:
+            position (int): Moves to have applied
+        """
+        self.replay.seek(position)
+        self.game_ui.mines_shown = self.replay.session.state == self.replay.session.LOST
+        self.game_ui.redraw()
+        self._show_position()
+
+    def _sync_mines(self):
+        """Show the mines only once the recorded game is lost."""
+        lost = self.replay.session.state == self.replay.session.LOST
+        if lost != self.game_ui.mines_shown:
+            self.game_ui.mines_shown = lost
+            self.game_ui.redraw()
+
+    def _show_position(self):
+        """Update the slider and the move counter."""
+        replay = self.replay
+        self.updating_slider = True
+        self.position_var.set(replay.position)
+        self.updating_slider = False
+        self.position_label.configure(text=f"{replay.position}/{replay.length} - {replay.elapsed() / 1000:.1f}s")
+        self.game_ui.update_timer(replay.elapsed() // 1000)
+
+    def destroy(self):
+        """Stop the playback and remove the player."""
+        self.pause()
+        self.game_ui.destroy()
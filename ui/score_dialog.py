@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from models.presets import DIFFICULTY_LEVELS
 
 
 class ScoreDialog:
@@ -48,118 +49,202 @@ class ScoreDialog:
 
 
 class ScoresWindow:
-    """Window for displaying high scores."""
-
-    DIFFICULTY_PRESETS = {
-        "Facile": {"width": 10, "height": 10, "mines": 10},
-        "Moyen": {"width": 16, "height": 16, "mines": 40},
-        "Difficile": {"width": 16, "height": 30, "mines": 99}
-    }
-
-    def __init__(self, root, scores, on_replay=None):
+    """Window for displaying high scores.
+
+    Each tab holds a single Treeview filled one page at a time as the list
+    is scrolled, so the window costs the same to open whatever the length
+    of the history.
+    """
+
+    DIFFICULTY_PRESETS = DIFFICULTY_LEVELS
+    PAGE_SIZE = 100  # Rows fetched at a time
+    COLUMNS = (
+        ("rank", "#", 50),
+        ("name", "Nom", 160),
+        ("time", "Temps", 70),
+        ("grid", "Grille", 120),
+        ("seed", "Seed", 120)
+    )
+
+    def __init__(self, root, score_manager, on_replay=None, on_watch=None):
         """Initialize the scores window.
 
         Args:
             root: Tkinter root window
-            scores (list): List of score dictionaries
+            score_manager: ScoreManager or SqliteScoreManager to read the scores from
             on_replay: Callback for replaying a game configuration
+            on_watch: Callback for watching the recorded moves of a score
         """
         self.window = tk.Toplevel(root)
         self.window.title("Meilleurs scores")
         self.window.geometry("600x500")
         self.on_replay = on_replay
+        self.on_watch = on_watch
+        self.score_manager = score_manager
+        self.tabs = {}  # Treeview -> paging state of its tab
+        self.tab_trees = {}  # Tab widget path -> Treeview of the tab
 
         # Create notebook for different difficulty tabs
-        notebook = ttk.Notebook(self.window)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook = ttk.Notebook(self.window)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
 
         # Create tabs for each difficulty
-        self.create_difficulty_tab(notebook, "Facile", scores)
-        self.create_difficulty_tab(notebook, "Moyen", scores)
-        self.create_difficulty_tab(notebook, "Difficile", scores)
-        self.create_difficulty_tab(notebook, "Personnalisé", scores)
+        self.create_difficulty_tab(self.notebook, "Facile")
+        self.create_difficulty_tab(self.notebook, "Moyen")
+        self.create_difficulty_tab(self.notebook, "Difficile")
+        self.create_difficulty_tab(self.notebook, "Personnalisé")
+
+        buttons = ttk.Frame(self.window)
+        buttons.pack(pady=(0, 10))
+        self.replay_button = None
+        self.watch_button = None
+        if self.on_replay:
+            self.replay_button = ttk.Button(buttons, text="Rejouer", state=tk.DISABLED,
+                                            command=self._replay_selected)
+            self.replay_button.pack(side=tk.LEFT, padx=5)
+        if self.on_watch:
+            self.watch_button = ttk.Button(buttons, text="Revoir la partie", state=tk.DISABLED,
+                                           command=self._watch_selected)
+            self.watch_button.pack(side=tk.LEFT, padx=5)
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._update_replay_button())
 
     def close(self):
         """Close the scores window."""
         self.window.destroy()
 
-    def create_difficulty_tab(self, notebook, difficulty, scores):
+    def create_difficulty_tab(self, notebook, difficulty):
         """Create a tab for a specific difficulty level.
 
         Args:
             notebook: Notebook widget
             difficulty (str): Difficulty level
-            scores (list): List of all scores
         """
         tab = ttk.Frame(notebook)
         notebook.add(tab, text=difficulty)
 
-        # Create scrollable frame
-        canvas = tk.Canvas(tab)
-        scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        tree = ttk.Treeview(tab, columns=[name for name, _, _ in self.COLUMNS],
+                            show="headings", selectmode="browse")
+        self.tab_trees[str(tab)] = tree
+        for name, heading, width in self.COLUMNS:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor=tk.W)
+        scrollbar = ttk.Scrollbar(tab, orient="vertical", command=tree.yview)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            # Fetch the next page once the end of the loaded rows is in sight
+            if float(last) > 0.9:
+                self._load_page(tree)
+
+        tree.configure(yscrollcommand=on_scroll)
+        tree.bind("<<TreeviewSelect>>", lambda e: self._update_replay_button())
+        tree.bind("<Double-1>", lambda e: self._replay_selected())
+
+        self.tabs[tree] = {
+            'configs': self.configs_for_difficulty(difficulty),
+            'position': 0,  # Configuration being paged through
+            'offset': 0,    # Scores of that configuration already shown
+            'rank': 0,
+            'scores': {}    # Row id -> score
+        }
+        self._load_page(tree)
+
+        if not self.tabs[tree]['scores']:
+            ttk.Label(tab, text="Aucun score pour cette difficulté").pack(pady=10)
+            return
+
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+    def configs_for_difficulty(self, difficulty):
+        """Get the board configurations shown by a difficulty tab.
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        Args:
+            difficulty (str): Selected difficulty level
 
-        # Filter scores for this difficulty
-        difficulty_scores = self.filter_scores_by_difficulty(scores, difficulty)
+        Returns:
+            list: (width, height, mines) tuples, in display order
+        """
+        if difficulty == "Personnalisé":
+            presets = {(preset['width'], preset['height'], preset['mines'])
+                       for preset in self.DIFFICULTY_PRESETS.values()}
+            return [config for config in self.score_manager.configs() if config not in presets]
 
-        if not difficulty_scores:
-            ttk.Label(scrollable_frame, text="Aucun score pour cette difficulté").pack(pady=10)
-        else:
-            for i, score in enumerate(difficulty_scores, 1):
-                self.create_score_frame(scrollable_frame, i, score)
+        preset = self.DIFFICULTY_PRESETS.get(difficulty)
+        if preset:
+            return [(preset['width'], preset['height'], preset['mines'])]
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        return []
 
-    def create_score_frame(self, parent, rank, score):
-        """Create a frame for displaying a single score.
+    def _load_page(self, tree):
+        """Append the next page of scores to a tab.
 
         Args:
-            parent: Parent widget
-            rank (int): Score rank
-            score (dict): Score data
+            tree: Treeview of the tab
         """
-        frame = ttk.Frame(parent)
-        frame.pack(fill=tk.X, padx=5, pady=5)
-
-        # Score information
-        info_frame = ttk.Frame(frame)
-        info_frame.pack(fill=tk.X)
-
-        ttk.Label(info_frame,
-                  text=f"#{rank} - {score['name']}",
-                  font=('TkDefaultFont', 10, 'bold')).pack(side=tk.LEFT, padx=5)
-        ttk.Label(info_frame,
-                  text=f"Temps: {score['time']}s").pack(side=tk.LEFT, padx=5)
-        ttk.Label(info_frame,
-                  text=f"Grille: {score['width']}x{score['height']}, Mines: {score['mines']}").pack(side=tk.LEFT,
-                                                                                                    padx=5)
-
-        # Add the seed if it exists
-        if 'seed' in score:
-            ttk.Label(info_frame,
-                      text=f"Seed: {score['seed']}").pack(side=tk.LEFT, padx=5)
-
-        if self.on_replay and 'seed' in score and 'first_click' in score:
-            ttk.Button(info_frame,
-                       text="Rejouer",
-                       command=lambda: self._handle_replay(
-                           score['height'],
-                           score['width'],
-                           score['mines'],
-                           score['seed'],
-                           score['first_click']
-                       )).pack(side=tk.RIGHT, padx=5)
-
-        ttk.Separator(frame, orient='horizontal').pack(fill=tk.X, pady=5)
+        state = self.tabs[tree]
+        configs = state['configs']
+        wanted = self.PAGE_SIZE
+        while wanted and state['position'] < len(configs):
+            page = self.score_manager.get_page(configs[state['position']], state['offset'], wanted)
+            for score in page:
+                state['rank'] += 1
+                row = tree.insert("", tk.END, values=(
+                    state['rank'],
+                    score['name'],
+                    f"{score['time']}s",
+                    f"{score['width']}x{score['height']}, {score['mines']} mines",
+                    score.get('seed', "")
+                ))
+                state['scores'][row] = score
+            wanted -= len(page)
+            if wanted:
+                # This configuration is exhausted, go on with the next one
+                state['position'] += 1
+                state['offset'] = 0
+            else:
+                state['offset'] += len(page)
+
+    def _selected_score(self):
+        """Get the score selected in the current tab.
+
+        Returns:
+            dict: Score data, or None if no row is selected
+        """
+        tree = self.tab_trees[self.notebook.select()]
+        selection = tree.selection()
+        if not selection:
+            return None
+        return self.tabs[tree]['scores'][selection[0]]
+
+    def _update_replay_button(self):
+        """Enable the buttons that apply to the selected score."""
+        score = self._selected_score()
+        if self.replay_button:
+            replayable = score is not None and 'seed' in score and 'first_click' in score
+            self.replay_button.configure(state=tk.NORMAL if replayable else tk.DISABLED)
+        if self.watch_button:
+            recorded = score is not None and 'moves' in score
+            self.watch_button.configure(state=tk.NORMAL if recorded else tk.DISABLED)
+
+    def _watch_selected(self):
+        """Play back the recorded moves of the selected score."""
+        score = self._selected_score()
+        if self.on_watch and score and 'moves' in score:
+            self.close()
+            self.on_watch(score)
+
+    def _replay_selected(self):
+        """Replay the game of the selected score."""
+        score = self._selected_score()
+        if self.on_replay and score and 'seed' in score and 'first_click' in score:
+            self._handle_replay(
+                score['height'],
+                score['width'],
+                score['mines'],
+                score['seed'],
+                score['first_click']
+            )
 
     def _handle_replay(self, height, width, mines, seed, first_click):
         """Handle replay button click.
@@ -176,30 +261,3 @@ class ScoresWindow:
         self.close()  # Close the scores window
         if self.on_replay:
             self.on_replay(height, width, mines, seed, first_click)
-
-    def filter_scores_by_difficulty(self, scores, difficulty):
-        """Filter scores to show only those matching the selected difficulty.
-
-        Args:
-            scores (list): List of all score records
-            difficulty (str): Selected difficulty level
-
-        Returns:
-            list: Filtered list of scores matching the difficulty criteria
-        """
-        if difficulty == "Personnalisé":
-            return [s for s in scores if not any(
-                s['width'] == preset['width'] and
-                s['height'] == preset['height'] and
-                s['mines'] == preset['mines']
-                for preset in self.DIFFICULTY_PRESETS.values()
-            )]
-
-        preset = self.DIFFICULTY_PRESETS.get(difficulty)
-        if preset:
-            return [s for s in scores if
-                    s['width'] == preset['width'] and
-                    s['height'] == preset['height'] and
-                    s['mines'] == preset['mines']]
-
-        return []
\ No newline at end of file